@@ -3,5 +3,6 @@
 from hypergraph.node import Node
 from hypergraph.edge import Edge
 from hypergraph.hypergraph import HyperGraph
+from hypergraph.array_hypergraph import ArrayHyperGraph
 
-__all__ = ['Node', 'Edge', 'HyperGraph']
+__all__ = ['Node', 'Edge', 'HyperGraph', 'ArrayHyperGraph']
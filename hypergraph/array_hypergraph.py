@@ -0,0 +1,217 @@
+import numpy as np
+from hypergraph.node import NodeBase
+from hypergraph.edge import EdgeBase
+from hypergraph.hypergraph import HyperGraph
+
+
+def _grow(array, needed):
+    """Return array with capacity for at least `needed` rows (amortized doubling)."""
+    if needed <= len(array):
+        return array
+    capacity = max(needed, 2 * len(array), 16)
+    grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class NodeView(NodeBase):
+    """Node whose coordinates live in the arrays of an ArrayHyperGraph."""
+
+    __slots__ = ("id", "label", "_store", "_index")
+
+    def __init__(self, store, index, label="V"):
+        self._store = store
+        self._index = index
+        self.id = None
+        self.label = label
+
+    @property
+    def x(self):
+        return float(self._store._xy[self._index, 0])
+
+    @x.setter
+    def x(self, value):
+        self._store._xy[self._index, 0] = value
+
+    @property
+    def y(self):
+        return float(self._store._xy[self._index, 1])
+
+    @y.setter
+    def y(self, value):
+        self._store._xy[self._index, 1] = value
+
+    @property
+    def z(self):
+        return float(self._store._z[self._index])
+
+    @z.setter
+    def z(self, value):
+        self._store._z[self._index] = value
+
+
+class EdgeView(EdgeBase):
+    """Edge whose node list is a slice of the CSR arrays of an ArrayHyperGraph."""
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store, index, is_border=False, label=None, R=False):
+        self._store = store
+        self._index = index
+        self.id = None
+        self._graph = None
+        self.B = is_border
+        self._label = label if label else ("E" if self.arity() == 2 else "Q")
+        self._R = R
+
+    def arity(self):
+        ptr = self._store._edge_ptr
+        return int(ptr[self._index + 1] - ptr[self._index])
+
+    def _node_indices(self):
+        ptr = self._store._edge_ptr
+        return self._store._edge_idx[ptr[self._index]:ptr[self._index + 1]].tolist()
+
+    @property
+    def nodes(self):
+        return tuple(map(self._store.nodes.__getitem__, self._node_indices()))
+
+    @property
+    def x(self):
+        indices = self._node_indices()
+        xy = self._store._xy
+        return float(sum(xy[i, 0] for i in indices)) / len(indices)
+
+    @property
+    def y(self):
+        indices = self._node_indices()
+        xy = self._store._xy
+        return float(sum(xy[i, 1] for i in indices)) / len(indices)
+
+
+class ArrayHyperGraph(HyperGraph):
+    """HyperGraph backend storing geometry and connectivity in NumPy arrays.
+
+    Node coordinates are kept in a growable (N, 2) float array and edges as a
+    CSR layout: edge k spans _edge_idx[_edge_ptr[k]:_edge_ptr[k + 1]], which
+    are indices into the node arrays. Node and Edge objects are lightweight
+    views over those arrays, so productions run against it unchanged while
+    centroids, bounding boxes and extents are computed vectorized.
+
+    Removed edges keep their slots in the arrays; only the view is dropped
+    from the graph, so indices stay stable.
+    """
+
+    def __init__(self, capacity=1024):
+        super().__init__()
+        self._xy = np.zeros((capacity, 2), dtype=np.float64)
+        self._z = np.zeros(capacity, dtype=np.float64)
+        self._n_nodes = 0
+
+        self._edge_ptr = np.zeros(capacity + 1, dtype=np.int64)
+        self._edge_idx = np.zeros(4 * capacity, dtype=np.int64)
+        self._n_edges = 0
+
+    @property
+    def coordinates(self):
+        """(N, 2) array of node coordinates, indexed like self.nodes."""
+        return self._xy[:self._n_nodes]
+
+    def _new_node(self, x, y, label):
+        index = self._n_nodes
+        self._xy = _grow(self._xy, index + 1)
+        self._z = _grow(self._z, index + 1)
+        self._xy[index] = (x, y)
+        self._n_nodes += 1
+        return NodeView(self, index, label)
+
+    def _new_edge(self, nodes, is_border, label):
+        indices = [node._index for node in nodes]
+        index = self._n_edges
+        start = int(self._edge_ptr[index])
+        stop = start + len(indices)
+
+        self._edge_ptr = _grow(self._edge_ptr, index + 2)
+        self._edge_idx = _grow(self._edge_idx, stop)
+        self._edge_idx[start:stop] = indices
+        self._edge_ptr[index + 1] = stop
+        self._n_edges += 1
+        return EdgeView(self, index, is_border, label)
+
+    def _new_nodes(self, coordinates, label):
+        start = self._n_nodes
+        stop = start + len(coordinates)
+        self._xy = _grow(self._xy, stop)
+        self._z = _grow(self._z, stop)
+        if coordinates:
+            self._xy[start:stop] = coordinates
+        self._n_nodes = stop
+        return [NodeView(self, index, label) for index in range(start, stop)]
+
+    def _new_edges(self, node_lists, borders, labels):
+        counts = np.fromiter((len(nodes) for nodes in node_lists), dtype=np.int64, count=len(node_lists))
+        first = self._n_edges
+        last = first + len(node_lists)
+        start = int(self._edge_ptr[first])
+        stop = start + int(counts.sum())
+
+        self._edge_ptr = _grow(self._edge_ptr, last + 1)
+        self._edge_idx = _grow(self._edge_idx, stop)
+        self._edge_idx[start:stop] = np.fromiter(
+            (node._index for nodes in node_lists for node in nodes), dtype=np.int64, count=stop - start
+        )
+        self._edge_ptr[first + 1:last + 1] = start + np.cumsum(counts)
+        self._n_edges = last
+        return [
+            EdgeView(self, index, border, label)
+            for index, border, label in zip(range(first, last), borders, labels)
+        ]
+
+    def _edge_slices(self, edges):
+        """Return (flat node indices, per-edge counts) for the given edges."""
+        rows = np.fromiter((edge._index for edge in edges), dtype=np.int64)
+        starts = self._edge_ptr[rows]
+        counts = self._edge_ptr[rows + 1] - starts
+        # concatenate the ranges starts[k] .. starts[k] + counts[k]
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        flat = offsets + np.arange(int(counts.sum()), dtype=np.int64)
+        return self._edge_idx[flat], counts
+
+    def centroids(self, edges=None):
+        """Return an (E, 2) array of centroids for edges (default: all edges)."""
+        edges = list(self._edges) if edges is None else list(edges)
+        if not edges:
+            return np.zeros((0, 2), dtype=np.float64)
+
+        flat, counts = self._edge_slices(edges)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        sums = np.add.reduceat(self._xy[flat], starts, axis=0)
+        return sums / counts[:, None]
+
+    def edge_bounding_boxes(self, edges=None):
+        """Return an (E, 4) array of (min_x, min_y, max_x, max_y) per edge."""
+        edges = list(self._edges) if edges is None else list(edges)
+        if not edges:
+            return np.zeros((0, 4), dtype=np.float64)
+
+        flat, counts = self._edge_slices(edges)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        xy = self._xy[flat]
+        return np.hstack((
+            np.minimum.reduceat(xy, starts, axis=0),
+            np.maximum.reduceat(xy, starts, axis=0),
+        ))
+
+    def bounding_box(self):
+        if not self._n_nodes:
+            return None
+        xy = self.coordinates
+        min_x, min_y = xy.min(axis=0)
+        max_x, max_y = xy.max(axis=0)
+        return float(min_x), float(min_y), float(max_x), float(max_y)
+
+    def find_nodes_in_box(self, min_x, min_y, max_x, max_y):
+        """Return nodes inside the axis-aligned box, in insertion order."""
+        xy = self.coordinates
+        mask = (xy[:, 0] >= min_x) & (xy[:, 0] <= max_x) & (xy[:, 1] >= min_y) & (xy[:, 1] <= max_y)
+        return [self.nodes[i] for i in np.flatnonzero(mask).tolist()]
@@ -1,18 +1,49 @@
 from hypergraph.node import Node
 
 
-class Edge:
-    def __init__(
-        self, nodes: list[Node] | tuple[Node, ...], is_border=False, label=None, R=False
-    ):
-        self.nodes = nodes
-        self.B = is_border
-        self.label = label if label else ("E" if len(self.nodes) == 2 else "Q")
-        self.R = R  # Refinement flag
+class EdgeBase:
+    """Behaviour shared by every edge and hyperedge, whatever stores its nodes.
+
+    Subclasses provide nodes and set id, B, _label, _R and _graph.
+    """
+
+    __slots__ = ("id", "B", "_label", "_R", "_graph")
+
+    @property
+    def x(self):
+        """Centroid x coordinate, derived from the nodes."""
+        return sum(node.x for node in self.nodes) / len(self.nodes)
+
+    @property
+    def y(self):
+        """Centroid y coordinate, derived from the nodes."""
+        return sum(node.y for node in self.nodes) / len(self.nodes)
+
+    @property
+    def label(self):
+        return self._label
+
+    @label.setter
+    def label(self, value):
+        old_key = self.index_key()
+        self._label = value
+        if self._graph is not None:
+            self._graph._reindex_edge(self, old_key)
+
+    @property
+    def R(self):
+        return self._R
 
-        self.x = sum(node.x for node in self.nodes) / len(self.nodes)
-        self.y = sum(node.y for node in self.nodes) / len(self.nodes)
+    @R.setter
+    def R(self, value):
+        old_key = self.index_key()
+        self._R = value
+        if self._graph is not None:
+            self._graph._reindex_edge(self, old_key)
 
+    def index_key(self):
+        """Key of the (label, arity, R) bucket this edge belongs to."""
+        return (self._label, len(self.nodes), self._R)
 
     @property
     def is_border(self):
@@ -32,3 +63,17 @@ class Edge:
             return f"HyperEdge({self.x:.2f}, {self.y:.2f}, label={self.label}, R={self.R}, nodes={len(self.nodes)})"
         else:
             return f"Edge({self.nodes[0]} - {self.nodes[1]}, B={self.B}, R={self.R}, label={self.label})"
+
+
+class Edge(EdgeBase):
+    __slots__ = ("nodes",)
+
+    def __init__(
+        self, nodes: list[Node] | tuple[Node, ...], is_border=False, label=None, R=False
+    ):
+        self.id = None  # assigned by the owning HyperGraph, monotonically increasing
+        self._graph = None  # owning HyperGraph, notified when label or R change
+        self.nodes = tuple(nodes)
+        self.B = is_border
+        self._label = label if label else ("E" if len(self.nodes) == 2 else "Q")
+        self._R = R  # Refinement flag
@@ -1,40 +1,435 @@
+import gc
+import heapq
+from contextlib import contextmanager
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
 from hypergraph.node import Node
 from hypergraph.edge import Edge
+from hypergraph.spatial import SpatialGrid, BoxGrid, point_in_polygon, points_in_polygons
 
 
 class HyperGraph:
     def __init__(self):
         self.nodes = []
-        self.edges = []
+        # insertion-ordered edge store; dict gives O(1) removal with stable order
+        self._edges = {}
+        # node -> ordered set (dict) of edges and hyperedges containing it
+        self._incidence = {}
+        # frozenset({node_1, node_2}) -> ordered set (dict) of 2-node edges
+        self._pair_index = {}
+        # spatial hash of node coordinates for find_node_near
+        self._node_grid = SpatialGrid()
+        # (label, arity, R) -> ordered set (dict) of edges, see get_edges
+        self._buckets = {}
+        self._unsorted_buckets = set()
+        # stable integer ids, see node() and edge()
+        self._nodes_by_id = {}
+        self._edges_by_id = {}
+        self._next_node_id = 0
+        self._next_edge_id = 0
+        # callbacks notified of structural changes, see subscribe()
+        self._listeners = []
+        # frozenset({node_1, node_2}) -> node breaking that side, see register_midpoint()
+        self._midpoints = {}
+        # bounding boxes of hyperedges for locate(), built on first use
+        self._element_grid = None
+        # spatial hash of edge centroids for edges_by_distance(), built on first use
+        self._centroid_grid = None
+
+    @property
+    def edges(self):
+        """Live, insertion-ordered view of all edges and hyperedges."""
+        return self._edges.keys()
+
+    def _new_node(self, x, y, label):
+        """Create a node object; storage backends override this."""
+        return Node(x, y, label=label)
+
+    def _new_edge(self, nodes, is_border, label):
+        """Create an edge object; storage backends override this."""
+        return Edge(nodes, is_border, label)
+
+    def _new_nodes(self, coordinates, label):
+        return [self._new_node(x, y, label) for x, y in coordinates]
+
+    def _new_edges(self, node_lists, borders, labels):
+        new_edge = self._new_edge
+        return [new_edge(nodes, border, label) for nodes, border, label in zip(node_lists, borders, labels)]
+
+    def _register_nodes(self, nodes, coordinates):
+        next_id = self._next_node_id
+        nodes_by_id = self._nodes_by_id
+        for node in nodes:
+            node.id = next_id
+            nodes_by_id[next_id] = node
+            next_id += 1
+        self._next_node_id = next_id
+
+        self.nodes.extend(nodes)
+        self._node_grid.insert_many(
+            (node, x, y) for node, (x, y) in zip(nodes, coordinates)
+        )
+        if self._listeners:
+            for node in nodes:
+                self._notify("node_added", node)
+
+    def _register_edges(self, edges):
+        store = self._edges
+        for edge in edges:
+            store[edge] = None
+        self._index_edges(edges)
+        if self._listeners:
+            for edge in edges:
+                self._notify("edge_added", edge)
+
+    def subscribe(self, callback):
+        """Call callback(event, element) after every structural change.
+
+        Events are "node_added", "edge_added", "edge_removed" and
+        "edge_changed" (label or R reassigned). Changes to B and to node
+        coordinates are not reported.
+        """
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        self._listeners.remove(callback)
+
+    def _notify(self, event, element):
+        for callback in self._listeners:
+            callback(event, element)
 
     def add_node(self, x, y, label="V"):
-        node = Node(x, y, label=label)
-        self.nodes.append(node)
+        node = self._new_node(x, y, label)
+        self._register_nodes((node,), ((x, y),))
         return node
 
+    def add_nodes_from(self, xy, label="V"):
+        """Add one node per (x, y) row of xy (sequence of pairs or (N, 2) array).
+
+        Returns the new nodes; their ids are consecutive, in row order.
+        """
+        with _gc_paused():
+            coordinates = xy.tolist() if hasattr(xy, "tolist") else [tuple(row) for row in xy]
+            nodes = self._new_nodes(coordinates, label)
+            self._register_nodes(nodes, coordinates)
+        return nodes
+
+    def add_edges_from(self, index_pairs, is_border=False, label="E"):
+        """Add 2-node edges between node ids given as (id_1, id_2) rows.
+
+        is_border and label may be a single value or one value per edge.
+        Returns the new edges in row order.
+        """
+        node = self._nodes_by_id.__getitem__
+        with _gc_paused():
+            rows = index_pairs.tolist() if hasattr(index_pairs, "tolist") else index_pairs
+            node_lists = [(node(a), node(b)) for a, b in rows]
+            edges = self._new_edges(
+                node_lists,
+                _broadcast(is_border, len(node_lists), "is_border"),
+                _broadcast(label, len(node_lists), "label"),
+            )
+            self._register_edges(edges)
+        return edges
+
+    def add_hyperedges_from(self, index_lists, labels="Q"):
+        """Add hyperedges over node ids, one id list per hyperedge.
+
+        labels may be a single label or one label per hyperedge.
+        Returns the new hyperedges in row order.
+        """
+        node = self._nodes_by_id.__getitem__
+        with _gc_paused():
+            rows = index_lists.tolist() if hasattr(index_lists, "tolist") else index_lists
+            node_lists = [tuple(node(i) for i in row) for row in rows]
+            edges = self._new_edges(
+                node_lists,
+                [False] * len(node_lists),
+                _broadcast(labels, len(node_lists), "labels"),
+            )
+            self._register_edges(edges)
+        return edges
+
+    def node(self, node_id):
+        """Return the node with the given id (KeyError if unknown)."""
+        return self._nodes_by_id[node_id]
+
+    def edge(self, edge_id):
+        """Return the edge or hyperedge with the given id (KeyError if removed or unknown)."""
+        return self._edges_by_id[edge_id]
+
+    def find_nodes_near(self, x, y, tol=1e-6):
+        """Return all nodes within distance tol of (x, y), oldest first."""
+        return self._node_grid.query(x, y, tol)
+
+    def find_node_near(self, x, y, tol=1e-6):
+        """Return the oldest node within distance tol of (x, y), or None."""
+        nodes = self._node_grid.query(x, y, tol)
+        return nodes[0] if nodes else None
+
     def add_edge(self, node_1, node_2, is_border=False, label="E"):
-        edge = Edge([node_1, node_2], is_border, label)
-        self.edges.append(edge)
+        edge = self._new_edge((node_1, node_2), is_border, label)
+        self._register_edges((edge,))
         return edge
 
     def add_hyperedge(self, nodes, label="Q"):
-        edge = Edge(nodes, label=label)
-        self.edges.append(edge)
+        edge = self._new_edge(nodes, False, label)
+        self._register_edges((edge,))
         return edge
 
+    def _index_edges(self, edges):
+        """Assign ids to new edges and add them to every index in one pass."""
+        next_id = self._next_edge_id
+        edges_by_id = self._edges_by_id
+        buckets = self._buckets
+        incidence = self._incidence
+        pair_index = self._pair_index
+
+        for edge in edges:
+            edge._graph = self
+            edge.id = next_id
+            edges_by_id[next_id] = edge
+            next_id += 1
+
+            nodes = edge.nodes
+            buckets.setdefault((edge._label, len(nodes), edge._R), {})[edge] = None
+            for node in nodes:
+                incident = incidence.get(node)
+                if incident is None:
+                    incidence[node] = {edge: None}
+                else:
+                    incident[edge] = None
+            if len(nodes) == 2:
+                pair_index.setdefault(frozenset(nodes), {})[edge] = None
+            elif self._element_grid is not None:
+                self._element_grid.insert(edge, _bounding_box(nodes))
+            if self._centroid_grid is not None:
+                self._centroid_grid.insert(edge, edge.x, edge.y)
+
+        self._next_edge_id = next_id
+
+    def _unindex_edge(self, edge):
+        edge._graph = None
+        self._edges_by_id.pop(edge.id, None)
+        if self._element_grid is not None:
+            self._element_grid.remove(edge)
+        if self._centroid_grid is not None:
+            self._centroid_grid.remove(edge, edge.x, edge.y)
+        self._remove_from_bucket(edge, edge.index_key())
+
+        nodes = edge.nodes
+        for node in nodes:
+            incident = self._incidence.get(node)
+            if incident is not None:
+                incident.pop(edge, None)
+        if len(nodes) == 2:
+            key = frozenset(nodes)
+            parallel = self._pair_index.get(key)
+            if parallel is not None:
+                parallel.pop(edge, None)
+                if not parallel:
+                    del self._pair_index[key]
+
+    def _remove_from_bucket(self, edge, key):
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.pop(edge, None)
+            if not bucket:
+                del self._buckets[key]
+                self._unsorted_buckets.discard(key)
+
+    def _reindex_edge(self, edge, old_key):
+        """Move edge between buckets after its label or R changed."""
+        new_key = edge.index_key()
+        if new_key == old_key:
+            return
+        self._remove_from_bucket(edge, old_key)
+
+        bucket = self._buckets.setdefault(new_key, {})
+        if bucket and next(reversed(bucket)).id > edge.id:
+            self._unsorted_buckets.add(new_key)
+        bucket[edge] = None
+        if self._listeners:
+            self._notify("edge_changed", edge)
+
+    def _sorted_bucket(self, key):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return {}
+        if key in self._unsorted_buckets:
+            bucket = dict.fromkeys(sorted(bucket, key=lambda e: e.id))
+            self._buckets[key] = bucket
+            self._unsorted_buckets.discard(key)
+        return bucket
+
+    def get_edges(self, label, arity, R=None):
+        """Return edges with given label, node count and (optionally) R.
+
+        The result is in the same order as self.edges, so productions that
+        take the first match keep behaving as with a full scan.
+        """
+        if R is not None:
+            return list(self._sorted_bucket((label, arity, R)))
+
+        keys = [key for key in self._buckets if key[0] == label and key[1] == arity]
+        if len(keys) == 1:
+            return list(self._sorted_bucket(keys[0]))
+        return list(heapq.merge(*(self._sorted_bucket(key) for key in keys), key=lambda e: e.id))
+
+    def incident_edges(self, node):
+        """Return edges and hyperedges containing node, in insertion order."""
+        return list(self._incidence.get(node, ()))
+
     def get_edge_between(self, node_1, node_2):
-        for edge in self.edges:
-            if not edge.is_hyperedge() and \
-               ((edge.nodes[0] == node_1 and edge.nodes[1] == node_2) or \
-                (edge.nodes[0] == node_2 and edge.nodes[1] == node_1)):
+        # Edges are keyed by their unordered endpoint pair, so an edge broken
+        # by P3 (kept next to its two halves) never collides with the halves.
+        # Parallel edges keep insertion order and the oldest one is returned.
+        parallel = self._pair_index.get(frozenset((node_1, node_2)))
+        if not parallel:
+            return None
+        return next(iter(parallel))
+
+    def register_midpoint(self, node_1, node_2, midpoint):
+        """Record midpoint as the node a production put between node_1 and node_2.
+
+        Productions breaking an edge register the new node, so later ones
+        can find it with get_midpoint() instead of searching the neighbours.
+        """
+        self._midpoints[frozenset((node_1, node_2))] = midpoint
+
+    def get_midpoint(self, node_1, node_2):
+        """Return the node registered between node_1 and node_2, or None.
+
+        The entry outlives the broken edge and its halves; callers check the
+        edges they need.
+        """
+        return self._midpoints.get(frozenset((node_1, node_2)))
+
+    def _element_index(self):
+        if self._element_grid is None:
+            hyperedges = [edge for edge in self._edges if len(edge.nodes) > 2]
+            boxes = [_bounding_box(edge.nodes) for edge in hyperedges]
+            # start with cells about the size of an average element
+            sizes = [max(box[2] - box[0], box[3] - box[1]) for box in boxes]
+            cell_size = sum(sizes) / len(sizes) if sizes and sum(sizes) > 0 else 1.0
+            grid = BoxGrid(cell_size)
+            for edge, box in zip(hyperedges, boxes):
+                grid.insert(edge, box)
+            self._element_grid = grid
+        return self._element_grid
+
+    def locate(self, x, y):
+        """Return the hyperedge whose polygon contains (x, y), or None.
+
+        The polygon of a hyperedge is given by its nodes in order; points on
+        a side shared by two elements go to the older one. The bounding
+        boxes of all hyperedges are put in a grid on the first call and
+        kept up to date afterwards (moving nodes is not tracked), so a
+        query only tests the few elements of one cell.
+        """
+        for edge in self._element_index().query_point(x, y):
+            if point_in_polygon(x, y, [(node.x, node.y) for node in edge.nodes]):
                 return edge
         return None
 
+    def locate_many(self, points):
+        """Return locate(x, y) for every (x, y) row of points, as a list.
+
+        Every point is paired with the candidates of its grid cell, and all
+        pairs are tested in one vectorized pass.
+        """
+        xy = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        grid = self._element_index()
+
+        cells = {}
+        for index, key in enumerate(map(tuple, np.floor(xy / grid.cell_size).astype(np.int64).tolist())):
+            cells.setdefault(key, []).append(index)
+
+        # (point, candidate) pairs, candidates of a point oldest first
+        pair_points = []
+        pair_edges = []
+        for indices in cells.values():
+            candidates = grid.cell(*xy[indices[0]])
+            for index in indices:
+                pair_points.extend([index] * len(candidates))
+                pair_edges.extend(candidates)
+
+        found = [None] * len(xy)
+        if not pair_edges:
+            return found
+
+        slots = {}
+        corners = []
+        for edge in pair_edges:
+            if edge not in slots:
+                slots[edge] = len(corners)
+                corners.append([(node.x, node.y) for node in edge.nodes])
+        width = max(len(polygon) for polygon in corners)
+        polygons = np.array([polygon + polygon[-1:] * (width - len(polygon)) for polygon in corners])
+
+        pair_points = np.array(pair_points)
+        inside = points_in_polygons(
+            xy[pair_points, 0], xy[pair_points, 1],
+            polygons[np.array([slots[edge] for edge in pair_edges])]
+        )
+
+        # the first containing candidate of every point wins
+        hits = np.flatnonzero(inside)
+        points_hit, first = np.unique(pair_points[hits], return_index=True)
+        for index, pair in zip(points_hit.tolist(), hits[first].tolist()):
+            found[index] = pair_edges[pair]
+        return found
+
+    def edges_by_distance(self, x, y, label, arity, R=None):
+        """Yield edges with given label, node count and (optionally) R, nearest centroid to (x, y) first.
+
+        Ties keep graph order. Edge centroids are put in a spatial hash on
+        the first call and kept up to date afterwards; the search reads
+        rings of doubling radius around (x, y), so the nearest edges are
+        found without looking at the rest of the graph. The generator must
+        not be resumed after the graph is modified.
+        """
+        if self._centroid_grid is None:
+            self._centroid_grid = SpatialGrid()
+            self._centroid_grid.insert_many((edge, edge.x, edge.y) for edge in self._edges)
+        grid = self._centroid_grid
+
+        if R is not None:
+            total = len(self._buckets.get((label, arity, R), ()))
+        else:
+            total = sum(len(bucket) for key, bucket in self._buckets.items() if key[0] == label and key[1] == arity)
+
+        seen = set()
+        radius = grid.cell_size
+        while len(seen) < total:
+            within = grid.query(x, y, radius)
+            ring = []
+            for edge in within:
+                if edge not in seen and edge._label == label and len(edge.nodes) == arity and (R is None or edge._R == R):
+                    ring.append(((edge.x - x) ** 2 + (edge.y - y) ** 2, edge.id, edge))
+            ring.sort(key=lambda entry: entry[:2])
+            for _, _, edge in ring:
+                seen.add(edge)
+                yield edge
+            if len(within) >= len(grid):
+                return
+            radius *= 2
+
     def remove_edge(self, edge):
-        if edge in self.edges:
-            self.edges.remove(edge)
+        if edge in self._edges:
+            del self._edges[edge]
+            self._unindex_edge(edge)
+            if self._listeners:
+                self._notify("edge_removed", edge)
+
+    def bounding_box(self):
+        """Return (min_x, min_y, max_x, max_y) over all nodes, or None if empty."""
+        if not self.nodes:
+            return None
+        all_x = [n.x for n in self.nodes]
+        all_y = [n.y for n in self.nodes]
+        return min(all_x), min(all_y), max(all_x), max(all_y)
 
     def print(self):
         print("Nodes:")
@@ -96,12 +491,10 @@ class HyperGraph:
                      fontsize=10, fontweight='bold', zorder=10)
 
         # Calculate bounds with margin
-        if self.nodes:
-            all_x = [n.x for n in self.nodes]
-            all_y = [n.y for n in self.nodes]
-            min_x, max_x = min(all_x), max(all_x)
-            min_y, max_y = min(all_y), max(all_y)
-            
+        bounds = self.bounding_box()
+        if bounds is not None:
+            min_x, min_y, max_x, max_y = bounds
+
             # Add 30% margin
             margin_x = (max_x - min_x) * 0.3 or 1
             margin_y = (max_y - min_y) * 0.3 or 1
@@ -128,4 +521,33 @@ class HyperGraph:
         else:
             plt.show()
 
-        plt.close()
\ No newline at end of file
+        plt.close()
+
+
+def _bounding_box(nodes):
+    xs = [node.x for node in nodes]
+    ys = [node.y for node in nodes]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _broadcast(value, count, name):
+    """Repeat a scalar count times, or check a per-item sequence has count items."""
+    if isinstance(value, str) or not hasattr(value, "__len__"):
+        return [value] * count
+    values = value.tolist() if hasattr(value, "tolist") else list(value)
+    if len(values) != count:
+        raise ValueError(f"{name} has {len(values)} values, expected {count}")
+    return values
+
+
+@contextmanager
+def _gc_paused():
+    """Suspend the cyclic GC during bulk construction; new elements are long-lived,
+    so collecting while they are allocated is wasted work."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
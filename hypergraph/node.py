@@ -1,11 +1,23 @@
-class Node:
-    def __init__(self, x, y, z=0, label="V"):
-        self.x = x
-        self.y = y
-        self.z = z
-        self.label = label
+class NodeBase:
+    """Behaviour shared by every node, whatever stores its coordinates.
+
+    Subclasses provide id, x, y, z and label.
+    """
+
+    __slots__ = ()
 
     def __str__(self):
         return (
             f"Node({self.x}, {self.y}, {self.z}, label={self.label})"
         )
+
+
+class Node(NodeBase):
+    __slots__ = ("id", "x", "y", "z", "label")
+
+    def __init__(self, x, y, z=0, label="V"):
+        self.id = None  # assigned by the owning HyperGraph, monotonically increasing
+        self.x = x
+        self.y = y
+        self.z = z
+        self.label = label
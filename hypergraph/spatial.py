@@ -0,0 +1,231 @@
+import math
+import numpy as np
+
+
+class SpatialGrid:
+    """Uniform-grid spatial hash over 2D points.
+
+    Items are bucketed into square cells of side cell_size. The grid halves
+    its cell size whenever occupied cells hold more than max_load items on
+    average, so queries stay local as the mesh gets refined.
+    """
+
+    def __init__(self, cell_size=1.0, max_load=8, min_cell_size=1e-9):
+        self.cell_size = cell_size
+        self.max_load = max_load
+        self.min_cell_size = min_cell_size
+        self._cells = {}
+        self._count = 0
+        self._seq = 0
+        self._next_check = 0
+
+    def __len__(self):
+        return self._count
+
+    def _key(self, x, y):
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, item, x, y):
+        self.insert_many(((item, x, y),))
+
+    def insert_many(self, entries):
+        """Insert (item, x, y) triples, refining the grid at most once."""
+        cells = self._cells
+        key = self._key
+        seq = self._seq
+        for item, x, y in entries:
+            cells.setdefault(key(x, y), {})[item] = (seq, x, y)
+            seq += 1
+        self._count += seq - self._seq
+        self._seq = seq
+
+        if self._count > self._next_check and self._count > self.max_load * len(self._cells):
+            self._refine()
+
+    def remove(self, item, x, y):
+        key = self._key(x, y)
+        cell = self._cells.get(key)
+        if cell is None or item not in cell:
+            return
+        del cell[item]
+        if not cell:
+            del self._cells[key]
+        self._count -= 1
+
+    def _refine(self):
+        while self.cell_size / 2 >= self.min_cell_size:
+            occupied = len(self._cells)
+            entries = [(item, entry) for cell in self._cells.values() for item, entry in cell.items()]
+
+            self.cell_size /= 2
+            self._cells = {}
+            for item, entry in entries:
+                self._cells.setdefault(self._key(entry[1], entry[2]), {})[item] = entry
+
+            if self._count <= self.max_load * len(self._cells):
+                break
+            if len(self._cells) < 2 * occupied:
+                # Points are clustered (e.g. coincident); splitting further
+                # does not help until the grid has grown substantially.
+                self._next_check = 2 * self._count
+                break
+
+    def query(self, x, y, tol):
+        """Return items within Euclidean distance tol of (x, y), oldest first."""
+        min_i, min_j = self._key(x - tol, y - tol)
+        max_i, max_j = self._key(x + tol, y + tol)
+
+        if (max_i - min_i + 1) * (max_j - min_j + 1) > len(self._cells):
+            cells = [
+                cell for (i, j), cell in self._cells.items()
+                if min_i <= i <= max_i and min_j <= j <= max_j
+            ]
+        else:
+            cells = [
+                self._cells[(i, j)]
+                for i in range(min_i, max_i + 1)
+                for j in range(min_j, max_j + 1)
+                if (i, j) in self._cells
+            ]
+
+        tol_sq = tol * tol
+        found = []
+        for cell in cells:
+            for item, (seq, px, py) in cell.items():
+                if (px - x) ** 2 + (py - y) ** 2 <= tol_sq:
+                    found.append((seq, item))
+
+        found.sort(key=lambda e: e[0])
+        return [item for _, item in found]
+
+
+class BoxGrid:
+    """Uniform grid over axis-aligned bounding boxes.
+
+    Every item is stored in each cell its box overlaps, so a point query
+    reads a single cell. Like SpatialGrid, the cell size halves whenever
+    cells hold more than max_load items on average, but never below the
+    smallest box, which would only copy items into more cells.
+    """
+
+    def __init__(self, cell_size=1.0, max_load=8, min_cell_size=1e-9):
+        self.cell_size = cell_size
+        self.max_load = max_load
+        self.min_cell_size = min_cell_size
+        self._cells = {}
+        # item -> (seq, box); box is (min_x, min_y, max_x, max_y)
+        self._boxes = {}
+        self._entries = 0
+        self._seq = 0
+        self._next_check = 0
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def _key(self, x, y):
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def _cell_keys(self, box):
+        min_i, min_j = self._key(box[0], box[1])
+        max_i, max_j = self._key(box[2], box[3])
+        return [(i, j) for i in range(min_i, max_i + 1) for j in range(min_j, max_j + 1)]
+
+    def insert(self, item, box):
+        entry = (self._seq, box)
+        self._seq += 1
+        self._boxes[item] = entry
+        for key in self._cell_keys(box):
+            self._cells.setdefault(key, {})[item] = entry
+            self._entries += 1
+
+        if self._entries > self._next_check and self._entries > self.max_load * len(self._cells):
+            self._refine()
+
+    def remove(self, item):
+        entry = self._boxes.pop(item, None)
+        if entry is None:
+            return
+        for key in self._cell_keys(entry[1]):
+            cell = self._cells.get(key)
+            if cell is not None and cell.pop(item, None) is not None:
+                self._entries -= 1
+                if not cell:
+                    del self._cells[key]
+
+    def _refine(self):
+        smallest = min(max(box[2] - box[0], box[3] - box[1]) for _, box in self._boxes.values())
+        limit = max(smallest, self.min_cell_size)
+        while self.cell_size / 2 >= limit and self._entries > self.max_load * len(self._cells):
+            self.cell_size /= 2
+            self._cells = {}
+            self._entries = 0
+            for item, entry in self._boxes.items():
+                for key in self._cell_keys(entry[1]):
+                    self._cells.setdefault(key, {})[item] = entry
+                    self._entries += 1
+
+        if self._entries > self.max_load * len(self._cells):
+            # Boxes overlap too much to be separated by smaller cells; wait
+            # until the grid has grown substantially before trying again.
+            self._next_check = 2 * self._entries
+
+    def query_point(self, x, y):
+        """Return items whose box contains (x, y), oldest first."""
+        cell = self._cells.get(self._key(x, y))
+        if not cell:
+            return []
+        found = [
+            (seq, item) for item, (seq, box) in cell.items()
+            if box[0] <= x <= box[2] and box[1] <= y <= box[3]
+        ]
+        found.sort(key=lambda e: e[0])
+        return [item for _, item in found]
+
+    def cell(self, x, y):
+        """Return the items of the cell containing (x, y), oldest first."""
+        cell = self._cells.get(self._key(x, y), {})
+        return [item for item, _ in sorted(cell.items(), key=lambda e: e[1][0])]
+
+
+def point_in_polygon(x, y, polygon):
+    """Return True if (x, y) lies inside polygon or on its boundary.
+
+    polygon is a sequence of (x, y) corners in order, either orientation.
+    """
+    inside = False
+    x1, y1 = polygon[-1]
+    for x2, y2 in polygon:
+        if x == x2 and y == y2:
+            return True
+        if (y1 > y) != (y2 > y):
+            cross_x = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            if x == cross_x:
+                return True
+            if x < cross_x:
+                inside = not inside
+        elif y1 == y == y2 and min(x1, x2) <= x <= max(x1, x2):
+            return True
+        x1, y1 = x2, y2
+    return inside
+
+
+def points_in_polygons(xs, ys, polygons):
+    """Vectorized point_in_polygon for point i against polygon i; returns a boolean array.
+
+    polygons is an (n, k, 2) array of corners; polygons with fewer than k
+    corners repeat their last corner.
+    """
+    inside = np.zeros(len(xs), dtype=bool)
+    boundary = np.zeros(len(xs), dtype=bool)
+    for j in range(polygons.shape[1]):
+        x1, y1 = polygons[:, j - 1, 0], polygons[:, j - 1, 1]
+        x2, y2 = polygons[:, j, 0], polygons[:, j, 1]
+        boundary |= (xs == x2) & (ys == y2)
+
+        spans = (y1 > ys) != (y2 > ys)
+        flat = y1 == y2
+        cross_x = x1 + (ys - y1) * (x2 - x1) / np.where(flat, 1.0, y2 - y1)
+        boundary |= spans & (xs == cross_x)
+        inside ^= spans & (xs < cross_x)
+        boundary |= flat & (ys == y1) & (xs >= np.minimum(x1, x2)) & (xs <= np.maximum(x1, x2))
+    return inside | boundary
@@ -0,0 +1,217 @@
+import os
+import sys
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import numpy as np
+from hypergraph.hypergraph import HyperGraph
+
+LABELS_BY_ARITY = {4: "Q", 5: "P", 6: "S", 7: "T"}
+
+# Extra vertices on the (bottom, top) side of a single-row strip cell
+STRIP_EXTRAS = {"Q": (0, 0), "P": (1, 0), "S": (1, 1), "T": (2, 1)}
+
+
+def _build_tiling(h_extras, v_extras, rng, jitter=0.0, bulge=0.1, marked=0.0, graph_cls=HyperGraph):
+    """Build an n x m tiling of polygons over a unit grid.
+
+    Every grid segment is split by a number of extra vertices, so cell
+    (i, j) becomes a polygon with 4 + (extras on its four sides) nodes.
+    Neighbouring cells share their segment, so shared E edges appear once
+    and only segments on the outer boundary are border edges.
+
+    Args:
+        h_extras: (n, m + 1) int array, extras on horizontal segment (i, j)
+            between corners (i, j) and (i + 1, j)
+        v_extras: (n + 1, m) int array, extras on vertical segment (i, j)
+            between corners (i, j) and (i, j + 1)
+        rng: numpy Generator used for jitter and marking
+        jitter: max random displacement of corner nodes (fraction of a cell)
+        bulge: perpendicular offset of extra vertices (fraction of a cell),
+            keeps polygons from having straight angles
+        marked: fraction of elements created with R=1
+        graph_cls: HyperGraph class to build (e.g. ArrayHyperGraph)
+    """
+    n, m = h_extras.shape[0], v_extras.shape[1]
+
+    corners = np.stack(np.meshgrid(np.arange(n + 1), np.arange(m + 1), indexing="ij"), axis=-1).astype(float)
+    if jitter:
+        interior = np.zeros((n + 1, m + 1, 2), dtype=bool)
+        interior[1:-1, :, 0] = True
+        interior[:, 1:-1, 1] = True
+        corners += interior * rng.uniform(-jitter, jitter, size=corners.shape)
+
+    xy = corners.reshape(-1, 2).tolist()
+
+    def corner(i, j):
+        return i * (m + 1) + j
+
+    def split(a, b, count, normal):
+        """Add count extra vertices between node ids a and b; return the full chain."""
+        chain = [a]
+        (ax, ay), (bx, by) = xy[a], xy[b]
+        for k in range(1, count + 1):
+            t = k / (count + 1)
+            xy.append((ax + t * (bx - ax) + bulge * normal[0], ay + t * (by - ay) + bulge * normal[1]))
+            chain.append(len(xy) - 1)
+        chain.append(b)
+        return chain
+
+    edge_pairs = []
+    border = []
+
+    def add_chain(chain, is_border):
+        for a, b in zip(chain, chain[1:]):
+            edge_pairs.append((a, b))
+            border.append(is_border)
+
+    horizontal = {}
+    for i in range(n):
+        for j in range(m + 1):
+            chain = split(corner(i, j), corner(i + 1, j), int(h_extras[i, j]), (0.0, 1.0))
+            horizontal[i, j] = chain
+            add_chain(chain, j == 0 or j == m)
+
+    vertical = {}
+    for i in range(n + 1):
+        for j in range(m):
+            chain = split(corner(i, j), corner(i, j + 1), int(v_extras[i, j]), (1.0, 0.0))
+            vertical[i, j] = chain
+            add_chain(chain, i == 0 or i == n)
+
+    polygons = []
+    for j in range(m):
+        for i in range(n):
+            # counter-clockwise: bottom, right (up), top (right to left), left (down)
+            ring = (
+                horizontal[i, j][:-1]
+                + vertical[i + 1, j][:-1]
+                + horizontal[i, j + 1][::-1][:-1]
+                + vertical[i, j][::-1][:-1]
+            )
+            polygons.append(ring)
+
+    labels = [LABELS_BY_ARITY.get(len(ring), "Q") for ring in polygons]
+
+    graph = graph_cls()
+    graph.add_nodes_from(xy)
+    graph.add_edges_from(edge_pairs, is_border=border)
+    elements = graph.add_hyperedges_from(polygons, labels=labels)
+
+    if marked:
+        for index in np.flatnonzero(rng.random(len(elements)) < marked).tolist():
+            elements[index].R = 1
+
+    return graph
+
+
+def create_quad_grid(n, m, seed=None, jitter=0.0, marked=0.0, graph_cls=HyperGraph):
+    """Create an n x m grid of quadrilaterals (Q) with border/shared E edges.
+
+    Produces the same graph as _build_tiling without extra vertices, but the
+    index arrays are built with NumPy, so 10^6-element grids load quickly.
+    """
+    rng = np.random.default_rng(seed)
+
+    corners = np.stack(np.meshgrid(np.arange(n + 1), np.arange(m + 1), indexing="ij"), axis=-1).astype(float)
+    if jitter:
+        interior = np.zeros((n + 1, m + 1, 2), dtype=bool)
+        interior[1:-1, :, 0] = True
+        interior[:, 1:-1, 1] = True
+        corners += interior * rng.uniform(-jitter, jitter, size=corners.shape)
+
+    ids = np.arange((n + 1) * (m + 1)).reshape(n + 1, m + 1)
+    horizontal = np.stack((ids[:-1, :], ids[1:, :]), axis=-1).reshape(-1, 2)
+    vertical = np.stack((ids[:, :-1], ids[:, 1:]), axis=-1).reshape(-1, 2)
+
+    h_border = np.zeros((n, m + 1), dtype=bool)
+    h_border[:, [0, m]] = True
+    v_border = np.zeros((n + 1, m), dtype=bool)
+    v_border[[0, n], :] = True
+
+    quads = np.stack((ids[:-1, :-1], ids[1:, :-1], ids[1:, 1:], ids[:-1, 1:]), axis=-1)
+    quads = quads.transpose(1, 0, 2).reshape(-1, 4)
+
+    graph = graph_cls()
+    graph.add_nodes_from(corners.reshape(-1, 2))
+    graph.add_edges_from(np.vstack((horizontal, vertical)), is_border=np.concatenate((h_border.ravel(), v_border.ravel())))
+    elements = graph.add_hyperedges_from(quads, labels="Q")
+
+    if marked:
+        for index in np.flatnonzero(rng.random(len(elements)) < marked).tolist():
+            elements[index].R = 1
+
+    return graph
+
+
+def create_polygon_strip(label, count, seed=None, jitter=0.0, marked=0.0, graph_cls=HyperGraph):
+    """Create a row of count elements of one type, each sharing an edge with the next.
+
+    Args:
+        label: "Q", "P", "S" or "T" (4, 5, 6 or 7 nodes per element)
+        count: number of elements in the strip
+    """
+    if label not in STRIP_EXTRAS:
+        raise ValueError(f"Unknown element label {label!r}, expected one of {sorted(STRIP_EXTRAS)}")
+
+    rng = np.random.default_rng(seed)
+    bottom, top = STRIP_EXTRAS[label]
+    h_extras = np.zeros((count, 2), dtype=int)
+    h_extras[:, 0] = bottom
+    h_extras[:, 1] = top
+    v_extras = np.zeros((count + 1, 1), dtype=int)
+    return _build_tiling(h_extras, v_extras, rng, jitter=jitter, marked=marked, graph_cls=graph_cls)
+
+
+def create_mixed_tiling(n, m, seed=None, jitter=0.0, marked=0.0, graph_cls=HyperGraph):
+    """Create an n x m tiling mixing Q, P, S and T elements.
+
+    Extra vertices are scattered over grid segments at random (seeded), with
+    at most 3 extras per cell so every element has between 4 and 7 nodes.
+    """
+    rng = np.random.default_rng(seed)
+    budget = np.full((n, m), 3, dtype=int)
+    h_extras = np.zeros((n, m + 1), dtype=int)
+    v_extras = np.zeros((n + 1, m), dtype=int)
+
+    segments = [("h", i, j) for i in range(n) for j in range(m + 1)]
+    segments += [("v", i, j) for i in range(n + 1) for j in range(m)]
+
+    for index in rng.permutation(len(segments)).tolist():
+        kind, i, j = segments[index]
+        if kind == "h":
+            cells = [(i, j - 1), (i, j)]
+        else:
+            cells = [(i - 1, j), (i, j)]
+        cells = [(ci, cj) for ci, cj in cells if 0 <= ci < n and 0 <= cj < m]
+
+        limit = min(budget[cell] for cell in cells)
+        count = int(rng.integers(0, min(limit, 2) + 1))
+        if not count:
+            continue
+        for cell in cells:
+            budget[cell] -= count
+        if kind == "h":
+            h_extras[i, j] = count
+        else:
+            v_extras[i, j] = count
+
+    return _build_tiling(h_extras, v_extras, rng, jitter=jitter, marked=marked, graph_cls=graph_cls)
+
+
+if __name__ == "__main__":
+    for name, build in [
+        ("quad grid 100x100", lambda: create_quad_grid(100, 100, seed=0)),
+        ("hexagon strip 1000", lambda: create_polygon_strip("S", 1000, seed=0)),
+        ("mixed tiling 100x100", lambda: create_mixed_tiling(100, 100, seed=0, jitter=0.1)),
+    ]:
+        start = time.perf_counter()
+        graph = build()
+        elapsed = time.perf_counter() - start
+
+        hyperedges = [e for e in graph.edges if e.is_hyperedge()]
+        counts = {label: sum(1 for e in hyperedges if e.label == label) for label in "QPST"}
+        print(f"{name}: {len(graph.nodes)} nodes, {len(graph.edges) - len(hyperedges)} edges, "
+              f"elements {counts} in {elapsed:.2f}s")
@@ -14,5 +14,10 @@ from productions.p9.p9 import P9
 from productions.p10.p10 import P10
 from productions.p11.p11 import P11
 from productions.p12.p12 import P12
+from productions.p13.p13 import P13
+from productions.p14.p14 import P14
+from productions.matcher import IncrementalMatcher, MatchCache
+from productions.scheduler import Scheduler, independent_matches
+from productions.marking import mark_by_error
 
-__all__ = ['Production', 'P0', 'P1', 'P2', 'P3', 'P4', 'P5', 'P6', 'P7', 'P8', 'P9', 'P10', 'P11', 'P12']
+__all__ = ['Production', 'P0', 'P1', 'P2', 'P3', 'P4', 'P5', 'P6', 'P7', 'P8', 'P9', 'P10', 'P11', 'P12', 'P13', 'P14', 'IncrementalMatcher', 'MatchCache', 'Scheduler', 'independent_matches', 'mark_by_error']
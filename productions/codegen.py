@@ -0,0 +1,120 @@
+"""Generate straight-line Python matchers for productions.pattern.Pattern.
+
+For a pattern the generator writes a small module with one match(graph,
+root) function in which every side is checked by its own statements,
+without loops, list appends or index arithmetic. Side edges are read from
+the graph's pair index and labels and flags from the edge slots directly,
+skipping get_edge_between() and the label/R properties.
+
+Modules are named after a hash of their source and cached in a directory
+(productions/_generated by default, ignored by git), so each pattern is
+generated once and later runs only import it.
+"""
+
+import hashlib
+import importlib.util
+import os
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_generated")
+
+
+def generate_source(pattern):
+    """Return the source of a module defining match(graph, root) for pattern."""
+    arity = pattern.arity
+    names = [f"n{i}" for i in range(arity)]
+    pairs = list(zip(names, names[1:] + names[:1])) if arity > 2 else [tuple(names)]
+
+    lines = [
+        f"# Generated by productions.codegen from {pattern!r}; do not edit.",
+        "from productions.pattern import Binding, EPSILON, _hanging_node",
+        "",
+        "",
+        "def match(graph, root):",
+        "    nodes = root.nodes",
+        f"    if len(nodes) != {arity} or root._label != {pattern.label!r} or root._R != {pattern.R!r}:",
+        "        return None",
+    ]
+    if pattern.border is not None:
+        lines += [f"    if {'not ' if pattern.border else ''}root.B:", "        return None"]
+    lines.append(f"    {', '.join(names)} = nodes")
+
+    sides = midpoints = halves = "None"
+
+    if pattern.sides:
+        lines.append("    pair = graph._pair_index.get")
+        conditions = []
+        if pattern.side_label is not None:
+            conditions.append("{0}._label != " + repr(pattern.side_label))
+        if pattern.side_R is not None:
+            conditions.append("{0}._R != " + repr(pattern.side_R))
+        for i, (a, b) in enumerate(pairs):
+            edge = f"s{i}"
+            lines += [
+                f"    parallel = pair(frozenset(({a}, {b})))",
+                "    if not parallel:",
+                "        return None",
+                f"    for {edge} in parallel:  # oldest of the parallel edges",
+                "        break",
+            ]
+            if conditions:
+                lines += [f"    if {' or '.join(c.format(edge) for c in conditions)}:", "        return None"]
+        sides = "[" + ", ".join(f"s{i}" for i in range(len(pairs))) + "]"
+
+    elif pattern.midpoints == "hanging":
+        for i, (a, b) in enumerate(pairs):
+            lines += [
+                f"    h{i} = _hanging_node(graph, {a}, {b}, {pattern.midpoint_R!r})",
+                f"    if h{i} is None:",
+                "        return None",
+            ]
+        midpoints = "[" + ", ".join(f"h{i}[0]" for i in range(len(pairs))) + "]"
+        halves = "[" + ", ".join(f"h{i}[1:]" for i in range(len(pairs))) + "]"
+
+    elif pattern.midpoints == "located":
+        lines += ["    registered = graph.get_midpoint", "    find = graph.find_node_near"]
+        for i, (a, b) in enumerate(pairs):
+            lines += [
+                f"    m{i} = registered({a}, {b})",
+                f"    if m{i} is None:",
+                f"        m{i} = find(({a}.x + {b}.x) / 2, ({a}.y + {b}.y) / 2, EPSILON)",
+                f"        if m{i} is None:",
+                "            return None",
+            ]
+        midpoints = "[" + ", ".join(f"m{i}" for i in range(len(pairs))) + "]"
+
+    elif pattern.midpoints == "absent":
+        lines += ["    between = graph.get_edge_between", "    near = graph.find_nodes_near"]
+        for a, b in pairs:
+            lines += [
+                f"    for node in near(({a}.x + {b}.x) / 2, ({a}.y + {b}.y) / 2, EPSILON):",
+                f"        if between({a}, node) and between(node, {b}):",
+                "            return None",
+            ]
+
+    lines.append(f"    return Binding(root, nodes, {sides}, {midpoints}, {halves})")
+    return "\n".join(lines) + "\n"
+
+
+def load_matcher(pattern, cache_dir=None):
+    """Return the generated match function for pattern, generating it if not cached.
+
+    Raises:
+        OSError: If the cache directory cannot be created or written
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    source = generate_source(pattern)
+    digest = hashlib.sha1(source.encode()).hexdigest()[:16]
+    path = os.path.join(cache_dir, f"match_{digest}.py")
+
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        # write under a temporary name first so concurrent runs never import a partial file
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as file:
+            file.write(source)
+        os.replace(temporary, path)
+
+    spec = importlib.util.spec_from_file_location(f"productions._generated.match_{digest}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.match
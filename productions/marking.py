@@ -0,0 +1,63 @@
+import math
+import numpy as np
+from productions.p0.p0 import P0
+from productions.p6.p6 import P6
+from productions.p9.p9 import P9
+from productions.p12.p12 import P12
+from productions.polygon import iter_family_matches
+
+# productions marking a single element; their patterns validate the sides
+MARKING_PRODUCTIONS = (P0, P6, P9, P12)
+
+
+def mark_by_error(graph, errors, threshold=None, fraction=None):
+    """Mark every Q, P, S and T element with a large error for refinement in one pass.
+
+    Candidates are the unmarked elements P0, P6, P9 and P12 could mark, i.e.
+    those with an edge on every side. Their errors are gathered into one
+    array and selected with a single comparison or partial sort, then R is
+    set to 1 on the selected elements.
+
+    Args:
+        graph: HyperGraph instance
+        errors: Array of error indicators indexed by hyperedge id
+        threshold: Mark candidates whose error is at least threshold
+        fraction: Mark this fraction of the candidates (rounded up), largest
+            errors first; ties keep graph order
+
+    Returns:
+        list: The marked elements, in graph order
+
+    Raises:
+        ValueError: If not exactly one of threshold and fraction is given,
+            fraction is outside [0, 1] or errors has no entry for a candidate
+    """
+    if (threshold is None) == (fraction is None):
+        raise ValueError("Give either threshold or fraction")
+    if fraction is not None and not 0 <= fraction <= 1:
+        raise ValueError(f"fraction must be between 0 and 1, got {fraction}")
+
+    errors = np.asarray(errors, dtype=np.float64)
+    productions = [production() for production in MARKING_PRODUCTIONS]
+    candidates = [matched['hyperedge'] for _, matched in iter_family_matches(graph, productions)]
+    if not candidates:
+        return []
+
+    ids = np.fromiter((edge.id for edge in candidates), dtype=np.int64, count=len(candidates))
+    if ids[-1] >= len(errors):
+        raise ValueError(f"errors has {len(errors)} entries, but element id {ids[-1]} is a candidate")
+    values = errors[ids]
+
+    if threshold is not None:
+        selected = np.flatnonzero(values >= threshold)
+    else:
+        # NaN errors are never selected
+        finite = np.flatnonzero(~np.isnan(values))
+        k = min(math.ceil(fraction * len(candidates)), len(finite))
+        order = np.argsort(-values[finite], kind="stable")[:k]
+        selected = np.sort(finite[order])
+
+    marked = [candidates[i] for i in selected.tolist()]
+    for edge in marked:
+        edge.R = 1
+    return marked
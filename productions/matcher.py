@@ -0,0 +1,215 @@
+class IncrementalMatcher:
+    """Keeps the matches of a set of productions up to date as the graph changes.
+
+    Every production is matched once against the whole graph; after that
+    the matcher listens to the graph's change notifications and, when
+    matches are requested, re-checks only the candidates around the
+    elements that changed since the last request.
+
+    A match may depend on its anchor (see Production.anchor), the nodes of
+    the anchor and the edges and nodes joined to them by an edge, so a
+    change at a node can only affect anchors containing that node or one of
+    its edge neighbours. Changes that are not reported by the graph (node
+    coordinates, the B flag) are not tracked.
+
+    Usage:
+        matcher = IncrementalMatcher(graph, [P0(), P1()])
+        matched = matcher.first(production)
+        production.apply(graph, matched)
+        ...
+        matcher.close()
+    """
+
+    def __init__(self, graph, productions):
+        self.graph = graph
+        self.productions = list(productions)
+        # production -> {anchor edge: match}, ordered like graph.edges
+        self._matches = {}
+        self._unsorted = set()
+        self._dirty_nodes = set()
+        self._dirty_edges = set()
+        # number of match_at() calls, full scans included
+        self.evaluations = 0
+        # productions that gained or updated matches; cleared by the caller
+        self.updated = set()
+
+        for production in self.productions:
+            if production.anchor is None:
+                raise ValueError(f"Production {production.name} does not declare an anchor")
+            found = {}
+            for edge in graph.get_edges(*production.anchor):
+                matched = production.match_at(graph, edge)
+                self.evaluations += 1
+                if matched is not None:
+                    found[edge] = matched
+            self._matches[production] = found
+
+        graph.subscribe(self._on_change)
+
+    def close(self):
+        """Stop listening to the graph."""
+        self.graph.unsubscribe(self._on_change)
+
+    def _on_change(self, event, element):
+        if event == "node_added":
+            self._dirty_nodes.add(element)
+            return
+        self._dirty_edges.add(element)
+        self._dirty_nodes.update(element.nodes)
+
+    def refresh(self):
+        """Re-check candidates around the changes reported since the last refresh."""
+        if not self._dirty_nodes and not self._dirty_edges:
+            return
+        anchors = sorted(_affected_anchors(self.graph, self._dirty_nodes, self._dirty_edges), key=lambda e: e.id)
+        self._dirty_nodes.clear()
+        self._dirty_edges.clear()
+
+        graph = self.graph
+        for production in self.productions:
+            found = self._matches[production]
+            key = production.anchor
+            for edge in anchors:
+                if edge.index_key() == key:
+                    matched = production.match_at(graph, edge)
+                    self.evaluations += 1
+                else:
+                    matched = None
+
+                if matched is None:
+                    found.pop(edge, None)
+                    continue
+                if edge not in found and found and next(reversed(found)).id > edge.id:
+                    self._unsorted.add(production)
+                found[edge] = matched
+                self.updated.add(production)
+
+    def matches(self, production):
+        """Return {anchor edge: match} for production, in graph order."""
+        self.refresh()
+        if production in self._unsorted:
+            found = self._matches[production]
+            self._matches[production] = dict(sorted(found.items(), key=lambda item: item[0].id))
+            self._unsorted.discard(production)
+        return self._matches[production]
+
+    def first(self, production):
+        """Return the match production.can_apply() would return, or None."""
+        return production.select_match(self.graph, self.matches(production))
+
+
+class MatchCache:
+    """Memoizes Production.match_at() per (production, anchor) while its region is unchanged.
+
+    Unlike IncrementalMatcher nothing is matched up front: a match is
+    computed the first time it is asked for and served from the cache until
+    the graph reports a change near its anchor (the same neighbourhood
+    IncrementalMatcher re-checks), so repeated queries about an unchanged
+    part of the graph are dictionary hits. Only the default arguments of
+    iter_matches() are cached; changes the graph does not report (node
+    coordinates, the B flag) are not seen.
+
+    Usage:
+        cache = MatchCache(graph)
+        can_apply, matched = cache.can_apply(production)
+        production.apply(graph, matched)
+        ...
+        cache.close()
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        # anchor edge -> {production: match or None}
+        self._entries = {}
+        self._dirty_nodes = set()
+        self._dirty_edges = set()
+        # lookups answered from the cache, and computed with match_at()
+        self.hits = 0
+        self.misses = 0
+        graph.subscribe(self._on_change)
+
+    def close(self):
+        """Stop listening to the graph and drop every entry."""
+        self.graph.unsubscribe(self._on_change)
+        self._entries.clear()
+
+    def _on_change(self, event, element):
+        if event == "node_added":
+            self._dirty_nodes.add(element)
+            return
+        self._dirty_edges.add(element)
+        self._dirty_nodes.update(element.nodes)
+
+    def _invalidate(self):
+        entries = self._entries
+        for edge in _affected_anchors(self.graph, self._dirty_nodes, self._dirty_edges):
+            entries.pop(edge, None)
+        self._dirty_nodes.clear()
+        self._dirty_edges.clear()
+
+    def match_at(self, production, edge):
+        """Return production.match_at(graph, edge), computing it only if its region changed."""
+        if self._dirty_nodes or self._dirty_edges:
+            self._invalidate()
+        cached = self._entries.setdefault(edge, {})
+        if production in cached:
+            self.hits += 1
+            return cached[production]
+        self.misses += 1
+        matched = cached[production] = production.match_at(self.graph, edge)
+        return matched
+
+    def matches(self, production):
+        """Return {anchor edge: match} for production, in graph order, like iter_matches()."""
+        if production.anchor is None:
+            raise ValueError(f"Production {production.name} does not declare an anchor")
+        found = {}
+        for edge in self.graph.get_edges(*production.anchor):
+            matched = self.match_at(production, edge)
+            if matched is not None:
+                found[edge] = matched
+        return found
+
+    def matches_at(self, production, element):
+        """Return production.matches_at(graph, element), from the cache."""
+        found = []
+        for edge in production.anchors_on(self.graph, element):
+            matched = self.match_at(production, edge)
+            if matched is not None:
+                found.append(matched)
+        return found
+
+    def nearest_matches(self, production, x, y):
+        """Yield production.nearest_matches(graph, x, y), from the cache."""
+        if production.anchor is None:
+            raise ValueError(f"Production {production.name} does not declare an anchor")
+        for edge in self.graph.edges_by_distance(x, y, *production.anchor):
+            matched = self.match_at(production, edge)
+            if matched is not None:
+                yield matched
+
+    def can_apply(self, production, hyperedge=None):
+        """Return (can_apply, matched) like production.can_apply(graph), from the cache.
+
+        With hyperedge, only the match rooted at that edge or hyperedge is
+        considered.
+        """
+        if hyperedge is not None:
+            matched = self.match_at(production, hyperedge)
+        else:
+            matched = production.select_match(self.graph, self.matches(production))
+        return matched is not None, matched
+
+
+def _affected_anchors(graph, dirty_nodes, dirty_edges):
+    """Edges whose matches may have changed: changed edges plus anchors near dirty nodes."""
+    ring = set(dirty_nodes)
+    for node in dirty_nodes:
+        for edge in graph.incident_edges(node):
+            if not edge.is_hyperedge():
+                ring.update(edge.nodes)
+
+    anchors = set(dirty_edges)
+    for node in ring:
+        anchors.update(graph.incident_edges(node))
+    return anchors
@@ -1,10 +1,15 @@
-from productions.production_base import Production
+from productions.pattern import Pattern
+from productions.polygon import MarkSides
 
-class P1(Production):
+
+class P1(MarkSides):
     """Production P1: Marks edges of quadrilateral element, marked
         for refinement, for breaking.
     """
 
+    pattern = Pattern("Q", 4, 1, sides=True, side_R=0)
+    anchor = pattern.anchor
+
     def __init__(self):
         super().__init__(
             name="P1",
@@ -12,47 +17,24 @@ class P1(Production):
         )
 
     def can_apply(self, graph, **kwargs):
-        hyperedge = None
+        marked = graph.get_edges("Q", 4, 1)
+        hyperedge = marked[-1] if marked else None
 
-        for edge in graph.edges:
-            if edge.label == "Q" and len(edge.nodes) == 4 and edge.R == 1:
-                hyperedge = edge
-  
         if not hyperedge:
             return False, None
-        
-        edges_found = []
-
-        nodes = hyperedge.nodes
-
-        for i in range(4):
-            node1 = nodes[i]
-            node2 = nodes[(i + 1) % 4]
-            found_edge = graph.get_edge_between(node1, node2)
-
-            if found_edge is None:
-                break
-            
-            # Check if edge is not already marked
-            if found_edge.R == 1:
-                break
-
-            edges_found.append(found_edge)
-        
-        if len(edges_found) != 4:
-            return False, None
-          
-        return True, {
-            'hyperedge': hyperedge,
-            'nodes': hyperedge.nodes,
-            'edges': edges_found
-        }
+
+        for matched in self.iter_matches(graph, hyperedge):
+            return True, matched
+        return False, None
+
+    def select_match(self, graph, matches):
+        """Only the most recently marked quadrilateral is considered, as in can_apply()."""
+        marked = graph.get_edges("Q", 4, 1)
+        return matches.get(marked[-1]) if marked else None
 
     def apply(self, graph, matched_elements):
         """Apply P1 to mark the quadrilateral for refinement."""
-        edges = matched_elements['edges']
-
-        for edge in edges:
+        for edge in matched_elements['edges']:
             edge.R = 1
 
         return {
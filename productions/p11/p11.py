@@ -1,98 +1,44 @@
 from productions.production_base import Production
+from productions.pattern import Pattern
 
 class P11(Production):
     """Production P11: Break the hexagonal element marked for refinement, if all its edges are broken.
     It sets value of attribute R of new hyperedges with label Q to 0.
     """
 
+    pattern = Pattern("S", 6, 1, midpoints="hanging", midpoint_R=0)
+    anchor = pattern.anchor
+
     def __init__(self):
         super().__init__(
             name="P11",
             description="Break the hexagonal element marked for refinement, if all its edges are broken."
         )
     
-    def _get_node_between(self, graph, node1, node2, desired_R=None):
-        """
-        Find and return a node between node1 and node2 [that is a hanging node].
-        Args:
-            graph: HyperGraph instance
-            node1: First node
-            node2: Second node
-            desired_R: Desired refinement flag of the edges connecting to the node
-        Returns:
-            Node instance if found, None otherwise
-        """
-        for node in graph.nodes:
-            
-            if node == node1 or node == node2:
-                continue
-
-            # if not node.is_hanging:
-            #     continue
-
-            edge1 = graph.get_edge_between(node1, node)
-            edge2 = graph.get_edge_between(node, node2)
-            if not edge1 or not edge2:
-                continue
-
-            if (desired_R is None or (edge1.R == desired_R and edge2.R == desired_R)):
-                return node
-        
-        return None
-
-
     def can_apply(self, graph, hyperedge=None, refinement_criterion=True):
         """Check if P11 can be applied to the graph.
 
         Args:
             refinement_criterion: External condition (e.g., error estimate) to decide if element should be refined
         """
-        hyperedges_to_check = [hyperedge] if hyperedge else graph.edges
-        if hyperedge and not refinement_criterion:
-            return False, None
-
-        for edge in hyperedges_to_check:
-            if not edge.is_hyperedge():
-                continue
-
-            # Check if it's a hexagonal (label S and 6 nodes)
-            if edge.label != "S" or len(edge.nodes) != 6:
-                continue
+        for matched in self.iter_matches(graph, hyperedge, refinement_criterion):
+            return True, matched
+        return False, None
 
-            # Check if R = 1 (marked for refinement)
-            if edge.R != 1:
-                continue
+    def iter_matches(self, graph, hyperedge=None, refinement_criterion=True):
+        """Yield every match of P11, in graph order."""
+        if hyperedge and not refinement_criterion:
+            return
 
-            nodes = edge.nodes
+        for found in self.pattern.iter_matches(graph, hyperedge):
             nodes_found = []
-            edges_found = []
-            
-            for i in range(6):
-                nodeA = nodes[i]
-                nodeB = nodes[(i + 1) % 6]
-                nodes_found.append(nodeA)
-
-                # Get node between node1 and node2 (A -- C -- B)
-                nodeC = self._get_node_between(graph, nodeA, nodeB, desired_R=0)
-                if not nodeC:
-                    break
-                nodes_found.append(nodeC)
-                
-                edgeAC = graph.get_edge_between(nodeA, nodeC)
-                edgeCB = graph.get_edge_between(nodeC, nodeB)
-                if not edgeAC or not edgeCB:
-                    break
-                edges_found.append(edgeAC)
-                edges_found.append(edgeCB)
-
-            if len(nodes_found) == 12 and len(edges_found) == 12:
-                return True, {
-                    'hyperedge': edge,
-                    'nodes': nodes_found,   # Even indices are original nodes, odd indices are hanging nodes
-                    'edges': edges_found
-                }
-
-        return False, None
+            for corner, midpoint in zip(found.nodes, found.midpoints):
+                nodes_found += [corner, midpoint]
+            yield {
+                'hyperedge': found.anchor,
+                'nodes': nodes_found,   # Even indices are original nodes, odd indices are hanging nodes
+                'edges': [edge for half in found.halves for edge in half]
+            }
 
     def apply(self, graph, matched_elements):
         """Apply P11 to break the hexagonal element marked"""
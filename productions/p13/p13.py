@@ -0,0 +1,18 @@
+from productions.pattern import Pattern
+from productions.polygon import MarkSides
+
+
+class P13(MarkSides):
+    """
+    Production P13: Marks edges of a heptagonal element marked for refinement (R=1)
+    by setting the R attribute of each boundary edge (label E) to 1.
+    """
+
+    pattern = Pattern("T", 7, 1, sides=True, side_label="E", side_R=0)
+    anchor = pattern.anchor
+
+    def __init__(self):
+        super().__init__(
+            name="P13",
+            description="Mark edges of heptagonal element for breaking"
+        )
@@ -0,0 +1,18 @@
+from productions.pattern import Pattern
+from productions.polygon import BreakElement
+
+
+class P14(BreakElement):
+    """
+    Production P14: Break heptagonal element marked for refinement into seven quadrilaterals.
+    Every side of the heptagon must already be broken by a hanging midpoint.
+    """
+
+    pattern = Pattern("T", 7, 1, midpoints="hanging", midpoint_R=0)
+    anchor = pattern.anchor
+
+    def __init__(self):
+        super().__init__(
+            name="P14",
+            description="Break heptagonal element marked for refinement into quadrilaterals"
+        )
@@ -1,4 +1,5 @@
 from productions.production_base import Production
+from productions.pattern import Pattern
 
 class P4(Production):
     """
@@ -6,6 +7,9 @@ class P4(Production):
     It sets value of attribute R of each hyperedge with label E to 0.
     """
 
+    pattern = Pattern("E", 2, 1, border=True)
+    anchor = pattern.anchor
+
     def __init__(self):
         super().__init__(
             name="P4",
@@ -18,23 +22,15 @@ class P4(Production):
         Args:
             hyperedge: Optional hyperedge to check; otherwise check all.
         """
-        hyperedges_to_check = [hyperedge] if hyperedge else graph.edges
-
-        for edge in hyperedges_to_check:
-            if not edge.is_border:
-                continue
-
-            if edge.label != "E":
-                continue
-
-            if edge.R != 1:
-                continue
-
-            return True, {'hyperedge': edge}
-
-
+        for matched in self.iter_matches(graph, hyperedge):
+            return True, matched
         return False, None
 
+    def iter_matches(self, graph, hyperedge=None):
+        """Yield every match of P4, in graph order."""
+        for found in self.pattern.iter_matches(graph, hyperedge):
+            yield {'hyperedge': found.anchor}
+
     def apply(self, graph, matched_elements):
         """Apply P4: break boundary edge marked for refinement into two edges with a new node in the middle."""
         edge = matched_elements['hyperedge']
@@ -44,6 +40,7 @@ class P4(Production):
         x_mid = (n1.x + n2.x) / 2
         y_mid = (n1.y + n2.y) / 2
         new_node = graph.add_node(x_mid, y_mid)
+        graph.register_midpoint(n1, n2, new_node)
 
         e1 = graph.add_hyperedge([n1, new_node], label="E")
         e1.R = 0
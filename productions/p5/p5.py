@@ -1,13 +1,15 @@
 from productions.production_base import Production
+from productions.pattern import Pattern
 from hypergraph.node import Node
 
-EPSILON = 1e-6
-
 class P5(Production):
     """Production P5: breaks the quadrilateral element marked for refinement, if all its edges are broken
     it sets value of attribute R of new hyperedges with label Q to 0
     """
 
+    pattern = Pattern("Q", 4, 1, midpoints="located")
+    anchor = pattern.anchor
+
     def __init__(self):
         super().__init__(
             name="P5",
@@ -20,38 +22,19 @@ class P5(Production):
         Args:
             refinement_criterion: External condition (e.g., error estimate) to decide if element should be refined
         """
-
-        for hyperedge in graph.edges:
-            if hyperedge.label == "Q" and len(hyperedge.nodes) == 4 and hyperedge.R == 1:
-                nodes = hyperedge.nodes
-
-                edges = []
-                for i in range(4):
-                    node_a = nodes[i]
-                    node_b = nodes[(i + 1) % 4]
-                    
-                    mid_x, mid_y = (node_a.x + node_b.x) / 2, (node_a.y + node_b.y) / 2
-                    
-                    found_mid = None
-                    for node in graph.nodes:
-                        if abs(node.x - mid_x) < EPSILON and abs(node.y - mid_y) < EPSILON:
-                            found_mid = node
-                            break
-                    
-                    if not found_mid:
-                        break 
-
-                    edges.append(found_mid)
-
-                if len(edges) == 4:
-                    return True, {
-                        'hyperedge': hyperedge,
-                        'nodes': nodes,
-                        'edges': edges 
-                    }
-        
+        for matched in self.iter_matches(graph):
+            return True, matched
         return False, None
 
+    def iter_matches(self, graph, hyperedge=None):
+        """Yield every match of P5, in graph order."""
+        for found in self.pattern.iter_matches(graph, hyperedge):
+            yield {
+                'hyperedge': found.anchor,
+                'nodes': found.nodes,
+                'edges': found.midpoints
+            }
+
     def apply(self, graph, matched_elements):
         hyperedge = matched_elements['hyperedge']
         n = matched_elements['nodes']
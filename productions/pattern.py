@@ -0,0 +1,242 @@
+from collections import namedtuple
+from productions import codegen
+
+EPSILON = 1e-6
+
+# Result of matching a Pattern at one root element:
+#   anchor    - the matched edge or hyperedge
+#   nodes     - its nodes, in order
+#   sides     - edge on every side, if the pattern requires them, else None
+#   midpoints - node in the middle of every side, if required, else None
+#   halves    - (first half, second half) edges of every side with a
+#               hanging midpoint, else None
+Binding = namedtuple("Binding", "anchor nodes sides midpoints halves")
+
+MIDPOINT_RULES = (None, "hanging", "located", "absent")
+
+
+class Pattern:
+    """Declarative left-hand side of a production, rooted at one edge or hyperedge.
+
+    The sides of a hyperedge root are the pairs of consecutive nodes
+    (nodes[i], nodes[i + 1]), wrapping around; a 2-node root has one side,
+    its own two nodes. The pattern is compiled once into a matcher that
+    reads candidates from the (label, arity, R) bucket and looks up side
+    edges and midpoints through the graph's pair and incidence indexes.
+    The matcher is generated Python source cached on disk (see
+    productions.codegen).
+
+    Args:
+        label: Label of the root
+        arity: Number of nodes of the root
+        R: Refinement flag of the root
+        border: Required B flag of the root, or None for any
+        sides: Require an edge on every side of the root (excludes midpoints)
+        side_label: Required label of the side edges, or None for any
+        side_R: Required R of the side edges, or None for any
+        midpoints: What must be in the middle of every side:
+            None      - nothing is checked
+            "hanging" - a node joined by an edge to both ends of the side
+            "located" - a node at the geometric midpoint of the side
+            For both, the midpoint registered with the graph (see
+            HyperGraph.register_midpoint) is tried before searching.
+            "absent"  - no node at the geometric midpoint joined to both ends
+        midpoint_R: Required R of both half edges of a hanging midpoint, or None
+    """
+
+    def __init__(self, label, arity, R, border=None, sides=False, side_label=None, side_R=None,
+                 midpoints=None, midpoint_R=None):
+        if midpoints not in MIDPOINT_RULES:
+            raise ValueError(f"Unknown midpoint rule {midpoints!r}, expected one of {MIDPOINT_RULES}")
+        if sides and midpoints:
+            raise ValueError("A pattern requires either side edges or midpoints, not both")
+        self.label = label
+        self.arity = arity
+        self.R = R
+        self.border = border
+        self.sides = sides
+        self.side_label = side_label
+        self.side_R = side_R
+        self.midpoints = midpoints
+        self.midpoint_R = midpoint_R
+        self.match = self.compile()
+
+    def __repr__(self):
+        options = [
+            f"{name}={value!r}"
+            for name, value, default in [
+                ("border", self.border, None), ("sides", self.sides, False),
+                ("side_label", self.side_label, None), ("side_R", self.side_R, None),
+                ("midpoints", self.midpoints, None), ("midpoint_R", self.midpoint_R, None),
+            ]
+            if value is not default
+        ]
+        return f"Pattern({', '.join([repr(self.label), repr(self.arity), repr(self.R)] + options)})"
+
+    @property
+    def anchor(self):
+        """(label, arity, R) bucket the root is taken from, see Production.anchor."""
+        return (self.label, self.arity, self.R)
+
+    def iter_matches(self, graph, anchor=None):
+        """Yield a Binding for every root matching the pattern, in graph order.
+
+        Args:
+            graph: HyperGraph instance
+            anchor: Optional single candidate to check instead of the whole bucket
+        """
+        candidates = [anchor] if anchor else graph.get_edges(*self.anchor)
+        match = self.match
+        for edge in candidates:
+            found = match(graph, edge)
+            if found is not None:
+                yield found
+
+    def compile(self, generated=True):
+        """Build the matcher function match(graph, root) -> Binding or None.
+
+        Only the checks the pattern asks for end up in the function. By
+        default it is generated straight-line code; with generated=False,
+        or if the generated module cannot be cached, it is composed from
+        closures instead.
+        """
+        if generated:
+            try:
+                return codegen.load_matcher(self)
+            except OSError:
+                pass
+
+        label, arity, R = self.anchor
+        border = self.border
+        find_sides = _side_finder(self.side_label, self.side_R) if self.sides else None
+        find_midpoints = _midpoint_finder(self.midpoints, self.midpoint_R)
+        wraps = arity > 2
+
+        def match(graph, root):
+            nodes = root.nodes
+            if len(nodes) != arity or root.label != label or root.R != R:
+                return None
+            if border is not None and bool(root.B) != border:
+                return None
+
+            pairs = zip(nodes, nodes[1:] + nodes[:1]) if wraps else (nodes,)
+
+            if find_sides is not None:
+                sides = find_sides(graph, pairs)
+                if sides is None:
+                    return None
+                return Binding(root, nodes, sides, None, None)
+
+            if find_midpoints is not None:
+                found = find_midpoints(graph, pairs)
+                if found is None:
+                    return None
+                return Binding(root, nodes, None, found[0], found[1])
+
+            return Binding(root, nodes, None, None, None)
+
+        return match
+
+
+def _side_finder(label, R):
+    if label is None and R is None:
+        def find_sides(graph, pairs):
+            between = graph.get_edge_between
+            found = []
+            for a, b in pairs:
+                edge = between(a, b)
+                if edge is None:
+                    return None
+                found.append(edge)
+            return found
+
+        return find_sides
+
+    def find_sides(graph, pairs):
+        between = graph.get_edge_between
+        found = []
+        for a, b in pairs:
+            edge = between(a, b)
+            if edge is None:
+                return None
+            if label is not None and edge.label != label:
+                return None
+            if R is not None and edge.R != R:
+                return None
+            found.append(edge)
+        return found
+
+    return find_sides
+
+
+def _midpoint_finder(rule, R):
+    if rule is None:
+        return None
+
+    if rule == "hanging":
+        def find_midpoints(graph, pairs):
+            midpoints = []
+            halves = []
+            for a, b in pairs:
+                found = _hanging_node(graph, a, b, R)
+                if found is None:
+                    return None
+                midpoints.append(found[0])
+                halves.append(found[1:])
+            return midpoints, halves
+
+    elif rule == "located":
+        def find_midpoints(graph, pairs):
+            registered = graph.get_midpoint
+            midpoints = []
+            for a, b in pairs:
+                node = registered(a, b)
+                if node is None:
+                    node = graph.find_node_near((a.x + b.x) / 2, (a.y + b.y) / 2, EPSILON)
+                    if node is None:
+                        return None
+                midpoints.append(node)
+            return midpoints, None
+
+    else:
+        def find_midpoints(graph, pairs):
+            between = graph.get_edge_between
+            for a, b in pairs:
+                for node in graph.find_nodes_near((a.x + b.x) / 2, (a.y + b.y) / 2, EPSILON):
+                    if between(a, node) and between(node, b):
+                        return None
+            return None, None
+
+    return find_midpoints
+
+
+def _hanging_node(graph, a, b, R=None):
+    """Return (node, edge a-node, edge node-b) for a node joined to both a and b.
+
+    The midpoint registered for a and b is returned if it qualifies;
+    otherwise the oldest qualifying node. Only nodes other than a and b
+    count, and if R is given both edges must have that refinement flag.
+    """
+    between = graph.get_edge_between
+    registered = graph.get_midpoint(a, b)
+    if registered is not None:
+        first = between(a, registered)
+        second = between(registered, b)
+        if first is not None and second is not None and (R is None or first.R == R == second.R):
+            return registered, first, second
+
+    best = None
+    for edge in graph.incident_edges(a):
+        if edge.is_hyperedge():
+            continue
+        node = edge.nodes[1] if edge.nodes[0] is a else edge.nodes[0]
+        if node is b or node is a or (best is not None and node.id >= best[0].id):
+            continue
+        second = between(node, b)
+        if second is None:
+            continue
+        first = between(a, node)
+        if R is not None and (first.R != R or second.R != R):
+            continue
+        best = (node, first, second)
+    return best
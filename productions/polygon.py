@@ -0,0 +1,196 @@
+import heapq
+from productions.production_base import Production
+
+# element label -> adjective used in messages
+ELEMENT_NAMES = {"Q": "quadrilateral", "P": "pentagonal", "S": "hexagonal", "T": "heptagonal"}
+
+
+class MarkElement(Production):
+    """Mark a polygonal element with an edge on every side for refinement (R: 0 -> 1).
+
+    Shared implementation of P0, P6, P9 and P12. Subclasses only declare
+    their pattern, e.g. Pattern("Q", 4, 0, sides=True), and may replace the
+    message apply() prints.
+    """
+
+    pattern = None
+    # printed by apply(), formatted with name, element and hyperedge
+    message = "[{name}] Marked {element} hyperedge for refinement (R: 0 -> 1)\n[{name}] Hyperedge: {hyperedge}"
+
+    def can_apply(self, graph, hyperedge=None, refinement_criterion=True):
+        """Check if the production can be applied to the graph.
+
+        Args:
+            refinement_criterion: External condition (e.g., error estimate) to decide if element should be refined
+        """
+        for matched in self.iter_matches(graph, hyperedge, refinement_criterion):
+            return True, matched
+        return False, None
+
+    def iter_matches(self, graph, hyperedge=None, refinement_criterion=True):
+        """Yield every match, in graph order."""
+        if not refinement_criterion:
+            return
+
+        for found in self.pattern.iter_matches(graph, hyperedge):
+            yield {
+                'hyperedge': found.anchor,
+                'nodes': found.nodes,
+                'edges': found.sides
+            }
+
+    def mutable_elements(self, matched_elements):
+        """Only the element hyperedge itself is modified."""
+        return [matched_elements['hyperedge']]
+
+    def apply(self, graph, matched_elements):
+        """Mark the element for refinement."""
+        hyperedge = matched_elements['hyperedge']
+
+        hyperedge.R = 1
+
+        print(self.message.format(name=self.name, element=ELEMENT_NAMES[hyperedge.label], hyperedge=hyperedge))
+
+        return {
+            'marked_hyperedge': hyperedge,
+            'nodes': matched_elements['nodes'],
+            'edges': matched_elements['edges']
+        }
+
+
+class MarkSides(Production):
+    """Mark the side edges of a polygonal element marked for refinement for breaking (E.R: 0 -> 1).
+
+    Shared implementation of P1, P7, P10 and P13. Subclasses only declare
+    their pattern, e.g. Pattern("S", 6, 1, sides=True, side_label="E", side_R=0),
+    and may replace the message apply() prints.
+    """
+
+    pattern = None
+    # printed by apply(), formatted with name and element
+    message = "[{name}] Marked edges of {element} element for breaking (E.R: 0 -> 1)"
+
+    def can_apply(self, graph, hyperedge=None):
+        for matched in self.iter_matches(graph, hyperedge):
+            return True, matched
+        return False, None
+
+    def iter_matches(self, graph, hyperedge=None):
+        """Yield every match, in graph order."""
+        for found in self.pattern.iter_matches(graph, hyperedge):
+            yield {
+                'hyperedge': found.anchor,
+                'nodes': found.nodes,
+                'edges': found.sides
+            }
+
+    def mutable_elements(self, matched_elements):
+        """Only the surrounding edges are modified."""
+        return matched_elements['edges']
+
+    def apply(self, graph, matched_elements):
+        """Mark every side edge of the element for breaking."""
+        for edge in matched_elements['edges']:
+            edge.R = 1
+
+        label = matched_elements['hyperedge'].label
+        print(self.message.format(name=self.name, element=ELEMENT_NAMES[label]))
+
+        return {
+            'hyperedge': matched_elements['hyperedge'],
+            'nodes': matched_elements['nodes'],
+            'marked_edges': matched_elements['edges']
+        }
+
+
+class BreakElement(Production):
+    """Break a marked polygonal element whose sides all have hanging midpoints.
+
+    The element is replaced by one quadrilateral per corner, joining the
+    corner, the midpoints of its two sides and a new central node.
+    Shared implementation of P8 and P14. Subclasses only declare their
+    pattern, e.g. Pattern("T", 7, 1, midpoints="hanging", midpoint_R=0),
+    and may replace the message apply() prints, or set it to None.
+    """
+
+    pattern = None
+    # printed by apply(), formatted with name, element and count
+    message = "[{name}] Broke {element} hyperedge into {count} quadrilaterals."
+
+    def can_apply(self, graph, hyperedge=None):
+        for matched in self.iter_matches(graph, hyperedge):
+            return True, matched
+        return False, None
+
+    def iter_matches(self, graph, hyperedge=None):
+        """Yield every match, in graph order."""
+        for found in self.pattern.iter_matches(graph, hyperedge):
+            yield {
+                'hyperedge': found.anchor,
+                'nodes': found.nodes,
+                'edges': [edge for half in found.halves for edge in half],
+                'midpoints': found.midpoints   # midpoints[i] breaks the side nodes[i] - nodes[i + 1]
+            }
+
+    def apply(self, graph, matched_elements, midpoints=None):
+        """Replace the element by quadrilaterals around a new central node.
+
+        Args:
+            midpoints: Optional hanging midpoints, one per side; by default
+                the ones found by can_apply()
+        """
+        hyperedge = matched_elements['hyperedge']
+        nodes = matched_elements['nodes']
+        if midpoints is None:
+            midpoints = matched_elements['midpoints']
+        count = len(nodes)
+
+        graph.remove_edge(hyperedge)
+
+        central_node = graph.add_node(
+            sum(node.x for node in nodes) / count,
+            sum(node.y for node in nodes) / count
+        )
+        central_node.z = sum(node.z for node in nodes) / count
+
+        for midpoint in midpoints:
+            graph.add_edge(central_node, midpoint, is_border=False, label="E")
+
+        quadrilaterals = []
+        for i in range(count):
+            quad = graph.add_hyperedge([nodes[i], midpoints[i], central_node, midpoints[i - 1]], label="Q")
+            quad.R = 0
+            quadrilaterals.append(quad)
+
+        if self.message is not None:
+            print(self.message.format(name=self.name, element=ELEMENT_NAMES[hyperedge.label], count=count))
+
+        return {
+            'original_hyperedge': hyperedge,
+            'central_node': central_node,
+            'midpoints': midpoints,
+            'quadrilaterals': quadrilaterals
+        }
+
+
+def iter_family_matches(graph, productions):
+    """Yield (production, match) for productions rooted at different element types, in graph order.
+
+    The candidates of all productions are read from the graph's (label,
+    arity, R) buckets and merged by id, so every element is classified and
+    checked once, whatever its type.
+
+    Raises:
+        ValueError: If two productions share an anchor
+    """
+    by_anchor = {}
+    for production in productions:
+        if production.anchor in by_anchor:
+            raise ValueError(f"Productions {by_anchor[production.anchor].name} and {production.name} share an anchor")
+        by_anchor[production.anchor] = production
+
+    candidates = heapq.merge(*(graph.get_edges(*key) for key in by_anchor), key=lambda e: e.id)
+    for edge in candidates:
+        production = by_anchor[edge.index_key()]
+        for matched in production.iter_matches(graph, edge):
+            yield production, matched
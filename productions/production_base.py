@@ -1,3 +1,7 @@
+from hypergraph.node import NodeBase
+from hypergraph.edge import EdgeBase
+
+
 class Production:
     """Base class for hypergraph grammar productions.
 
@@ -6,6 +10,10 @@ class Production:
     - Right-hand side (RHS): replacement pattern
     """
 
+    # (label, arity, R) bucket of the edge or hyperedge every match is rooted
+    # at, or None; lets productions.matcher re-check single candidates
+    anchor = None
+
     def __init__(self, name, description):
         """Initialize production.
 
@@ -30,6 +38,101 @@ class Production:
         """
         raise NotImplementedError(f"Production {self.name} must implement can_apply()")
 
+    def iter_matches(self, graph, **kwargs):
+        """Yield every match of the left-hand side in the graph.
+
+        Candidates are visited once, in graph order, and each match is the
+        same dictionary can_apply() would return for it. Matches are only
+        valid until the graph is modified.
+
+        Args:
+            graph: HyperGraph instance
+            **kwargs: Additional parameters for pattern matching
+
+        Yields:
+            dict: Matched graph elements, accepted by apply()
+        """
+        raise NotImplementedError(f"Production {self.name} must implement iter_matches()")
+
+    def match_at(self, graph, edge):
+        """Return the match rooted at edge, or None.
+
+        edge counts only while it is in the graph and in the anchor bucket;
+        the match is the one iter_matches() yields for it.
+        """
+        if self.anchor is None:
+            raise NotImplementedError(f"Production {self.name} does not declare an anchor")
+        if edge not in graph.edges or edge.index_key() != self.anchor:
+            return None
+        return next(self.iter_matches(graph, edge), None)
+
+    def matches_at(self, graph, element):
+        """Return the matches anchored on a node, edge or hyperedge, in graph order.
+
+        Accepts any element, whatever the production's anchor; see
+        anchors_on() for which anchors count. Only edges incident to the
+        nodes of element are visited, so the cost depends on their degree,
+        not on the size of the graph.
+        """
+        found = []
+        for edge in self.anchors_on(graph, element):
+            matched = self.match_at(graph, edge)
+            if matched is not None:
+                found.append(matched)
+        return found
+
+    def anchors_on(self, graph, element):
+        """Return the edges of the anchor bucket lying on element, in graph order.
+
+        An anchor lies on element if the nodes of one include the nodes of
+        the other: the anchors containing a node, an edge itself or the
+        hyperedges on either side of it, a hyperedge itself or its sides.
+        """
+        if self.anchor is None:
+            raise NotImplementedError(f"Production {self.name} does not declare an anchor")
+        if isinstance(element, NodeBase):
+            nodes = {element}
+        elif element in graph.edges:
+            nodes = set(element.nodes)
+        else:
+            return []
+
+        found = {}
+        for node in nodes:
+            for edge in graph.incident_edges(node):
+                if edge not in found and edge.index_key() == self.anchor:
+                    others = set(edge.nodes)
+                    if others <= nodes or nodes <= others:
+                        found[edge] = None
+        return sorted(found, key=lambda e: e.id)
+
+    def nearest_matches(self, graph, x, y):
+        """Yield matches by increasing distance of their anchor's centroid from (x, y).
+
+        Ties keep graph order. Candidates come from
+        HyperGraph.edges_by_distance(), so taking the first few matches only
+        checks the anchors around (x, y). Matches are only valid until the
+        graph is modified.
+        """
+        if self.anchor is None:
+            raise NotImplementedError(f"Production {self.name} does not declare an anchor")
+        for edge in graph.edges_by_distance(x, y, *self.anchor):
+            matched = self.match_at(graph, edge)
+            if matched is not None:
+                yield matched
+
+    def select_match(self, graph, matches):
+        """Return the match can_apply() would pick among all current matches.
+
+        Args:
+            graph: HyperGraph instance
+            matches: Mapping of anchor edge -> match, in graph order
+
+        Returns:
+            dict or None: The match to apply
+        """
+        return next(iter(matches.values()), None)
+
     def apply(self, graph, matched_elements):
         """Apply the production transformation to the graph.
 
@@ -42,5 +145,67 @@ class Production:
         """
         raise NotImplementedError(f"Production {self.name} must implement apply()")
 
+    def mutable_elements(self, matched_elements):
+        """Return the nodes and edges apply() may modify or remove for this match.
+
+        Matches whose mutable elements are disjoint can be applied in one
+        batch (see productions.scheduler). By default every node and edge of
+        the match counts; productions that only mark elements narrow it down.
+        """
+        return list(_elements(matched_elements))
+
+    def match_to_ids(self, matched_elements):
+        """Encode matched elements as nested tuples of ids.
+
+        Nodes and edges are replaced by their graph ids, so the result is
+        cheap to pickle and can be sent to another process holding a copy of
+        the same graph. Use match_from_ids() to turn it back into a dict.
+        """
+        return _encode(matched_elements)
+
+    def match_from_ids(self, graph, ids):
+        """Rebuild the matched elements dict encoded by match_to_ids()."""
+        return _decode(graph, ids)
+
     def __str__(self):
         return f"Production {self.name}: {self.description}"
+
+
+def _elements(value):
+    if isinstance(value, (NodeBase, EdgeBase)):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _elements(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _elements(item)
+
+
+def _encode(value):
+    if isinstance(value, NodeBase):
+        return ("N", value.id)
+    if isinstance(value, EdgeBase):
+        return ("E", value.id)
+    if isinstance(value, dict):
+        return ("D", tuple((key, _encode(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return ("L", tuple(_encode(item) for item in value))
+    if isinstance(value, tuple):
+        return ("T", tuple(_encode(item) for item in value))
+    return ("V", value)
+
+
+def _decode(graph, encoded):
+    kind, value = encoded
+    if kind == "N":
+        return graph.node(value)
+    if kind == "E":
+        return graph.edge(value)
+    if kind == "D":
+        return {key: _decode(graph, item) for key, item in value}
+    if kind == "L":
+        return [_decode(graph, item) for item in value]
+    if kind == "T":
+        return tuple(_decode(graph, item) for item in value)
+    return value
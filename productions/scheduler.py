@@ -0,0 +1,146 @@
+from collections import deque
+from productions.matcher import IncrementalMatcher
+
+
+class Scheduler:
+    """Applies productions until none of them matches, re-checking only what changed.
+
+    Matches are kept by an IncrementalMatcher, which records the elements
+    each application adds, removes or modifies and re-checks only candidates
+    near them. The fixed point is detected from those live matches, without
+    a final scan of the graph.
+
+    In deterministic mode the productions are applied in the same order as
+    the apply_while loop: each production in turn is applied while it
+    matches, and the list is repeated until a whole pass applies nothing.
+    Otherwise a worklist is used: after an application only productions that
+    gained matches are queued, and the current production keeps draining.
+
+    Iterating yields (production, matched) pairs that the caller applies:
+
+        for production, matched in Scheduler(graph, productions):
+            production.apply(graph, matched)
+
+    Every yielded match must be applied before asking for the next one.
+    """
+
+    def __init__(self, graph, productions, deterministic=True):
+        self.graph = graph
+        self.productions = list(productions)
+        self.deterministic = deterministic
+        # matcher of the current run, None between runs
+        self.matcher = None
+
+    def __iter__(self):
+        self.matcher = IncrementalMatcher(self.graph, self.productions)
+        try:
+            if self.deterministic:
+                yield from self._passes()
+            else:
+                yield from self._worklist()
+        finally:
+            self.matcher.close()
+
+    def run(self):
+        """Apply productions until none matches; return the number of applications."""
+        applied = 0
+        for production, matched in self:
+            production.apply(self.graph, matched)
+            applied += 1
+        return applied
+
+    def run_batched(self):
+        """Apply productions in rounds of non-overlapping matches until none matches.
+
+        In each round every production, in list order, applies in one step
+        a maximal subset of its current matches that share no element it
+        modifies (see independent_matches). A round that leaves the graph
+        unchanged also ends the run, so a production whose matches survive
+        its own apply() cannot loop forever.
+
+        Returns:
+            tuple: (rounds, applications) needed to reach the fixed point
+        """
+        self.matcher = matcher = IncrementalMatcher(self.graph, self.productions)
+        changes = []
+
+        def on_change(event, element):
+            changes.append(element)
+
+        self.graph.subscribe(on_change)
+        rounds = applied = 0
+        try:
+            while any(matcher.matches(production) for production in self.productions):
+                changes.clear()
+                rounds += 1
+                for production in self.productions:
+                    batch = independent_matches(production, matcher.matches(production).values())
+                    for matched in batch:
+                        production.apply(self.graph, matched)
+                    applied += len(batch)
+                if not changes:
+                    break
+        finally:
+            self.graph.unsubscribe(on_change)
+            matcher.close()
+        return rounds, applied
+
+    def _pending(self):
+        return [production for production in self.productions if self.matcher.first(production) is not None]
+
+    def _passes(self):
+        matcher = self.matcher
+        while True:
+            for production in self.productions:
+                matched = matcher.first(production)
+                while matched is not None:
+                    yield production, matched
+                    matched = matcher.first(production)
+
+            # a further pass would apply something only if a match is pending
+            if not self._pending():
+                return
+
+    def _worklist(self):
+        matcher = self.matcher
+        queue = deque(self.productions)
+        queued = set(queue)
+
+        while queue:
+            production = queue.popleft()
+            queued.discard(production)
+
+            matched = matcher.first(production)
+            if matched is None:
+                if not queue:
+                    queue.extend(p for p in self._pending() if p not in queued)
+                    queued.update(queue)
+                continue
+
+            matcher.updated.clear()
+            yield production, matched
+            matcher.refresh()
+
+            queue.appendleft(production)
+            queued.add(production)
+            for other in self.productions:
+                if other in matcher.updated and other not in queued:
+                    queue.append(other)
+                    queued.add(other)
+
+
+def independent_matches(production, matches):
+    """Greedily pick, in order, matches whose mutable elements do not overlap.
+
+    The result is maximal: every match left out shares a node or edge that
+    production.apply() modifies with a picked one, so the picked matches can
+    all be applied without invalidating each other.
+    """
+    taken = set()
+    chosen = []
+    for matched in list(matches):
+        elements = production.mutable_elements(matched)
+        if taken.isdisjoint(elements):
+            taken.update(elements)
+            chosen.append(matched)
+    return chosen
@@ -0,0 +1,58 @@
+import math
+
+
+def signed_area(nodes):
+    return sum(a.x * b.y - b.x * a.y for a, b in zip(nodes, nodes[1:] + nodes[:1])) / 2
+
+
+def create_broken_polygon(graph, label, count, r_value=1, broken=None):
+    """Regular polygon with border sides; sides listed in broken (all by default) get a hanging midpoint.
+
+    Returns:
+        tuple: (nodes, midpoints, hyperedge); nodes[i].z is i
+    """
+    if broken is None:
+        broken = range(count)
+
+    nodes = []
+    for i in range(count):
+        angle = 2.0 * math.pi * i / count
+        node = graph.add_node(math.cos(angle), math.sin(angle))
+        node.z = float(i)
+        nodes.append(node)
+
+    midpoints = []
+    for i in range(count):
+        n1 = nodes[i]
+        n2 = nodes[(i + 1) % count]
+        if i in broken:
+            mid = graph.add_node((n1.x + n2.x) / 2, (n1.y + n2.y) / 2)
+            graph.add_edge(n1, mid, is_border=True)
+            graph.add_edge(mid, n2, is_border=True)
+            midpoints.append(mid)
+        else:
+            graph.add_edge(n1, n2, is_border=True)
+
+    hyperedge = graph.add_hyperedge(nodes, label=label)
+    hyperedge.R = r_value
+    return nodes, midpoints, hyperedge
+
+
+def assert_broken_into_quadrilaterals(test, graph, nodes, midpoints, center):
+    """Check the element on nodes was replaced by one counter-clockwise quadrilateral per corner."""
+    count = len(nodes)
+    test.assertAlmostEqual(center.x, sum(n.x for n in nodes) / count)
+    test.assertAlmostEqual(center.y, sum(n.y for n in nodes) / count)
+    test.assertEqual(center.z, sum(n.z for n in nodes) / count)
+
+    for mid in midpoints:
+        spoke = graph.get_edge_between(center, mid)
+        test.assertIsNotNone(spoke)
+        test.assertEqual((spoke.label, spoke.R, spoke.B), ("E", 0, False))
+
+    quads = graph.get_edges("Q", 4, 0)
+    test.assertEqual(len(quads), count)
+    for i, quad in enumerate(quads):
+        test.assertEqual(list(quad.nodes), [nodes[i], midpoints[i], center, midpoints[i - 1]])
+        test.assertGreater(signed_area(list(quad.nodes)), 0)
+    test.assertAlmostEqual(sum(signed_area(list(q.nodes)) for q in quads), signed_area(nodes))
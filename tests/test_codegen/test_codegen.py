@@ -0,0 +1,73 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.append(project_root)
+sys.path.append(os.path.join(project_root, 'loops'))
+from productions import P0, P1, P2, P3, P4, P5, P6, P7, P8, P9, P10, P11, P12, Scheduler, codegen
+from productions.pattern import Pattern
+from mesh_generator import create_mixed_tiling
+
+
+def all_patterns():
+    return [production.pattern for production in (P0, P1, P2, P3, P4, P5, P6, P7, P8, P9, P10, P11, P12)]
+
+
+class TestCodegen(unittest.TestCase):
+
+    def assertSameMatches(self, graph, patterns):
+        """Generated and closure matchers give the same Binding for every element."""
+        for pattern in patterns:
+            closures = pattern.compile(generated=False)
+            for edge in list(graph.edges):
+                self.assertEqual(pattern.match(graph, edge), closures(graph, edge), pattern)
+
+    def test_generated_matchers_agree_with_closures(self):
+        """Test every production pattern matches the same roots as the closure matcher during refinement."""
+        graph = create_mixed_tiling(3, 3, seed=2, marked=0.5)
+        patterns = all_patterns()
+        productions = [P9(), P10(), P4(), P3(), P11(), P1(), P4(), P2(), P3(), P5()]
+
+        self.assertSameMatches(graph, patterns)
+        for step, (production, matched) in enumerate(Scheduler(graph, productions)):
+            production.apply(graph, matched)
+            if step % 5 == 0:
+                self.assertSameMatches(graph, patterns)
+        self.assertSameMatches(graph, patterns)
+
+    def test_sides_are_unrolled(self):
+        """Test side checks of a polygon pattern are emitted without loops over the nodes."""
+        source = codegen.generate_source(Pattern("S", 6, 1, sides=True, side_label="E", side_R=0))
+
+        self.assertNotIn("for n", source)
+        self.assertNotIn("%", source)
+        self.assertNotIn("append", source)
+        for i in range(6):
+            self.assertIn(f"s{i}._label != 'E' or s{i}._R != 0", source)
+
+    def test_module_is_cached(self):
+        """Test the generated module is written once and reused afterwards."""
+        pattern = Pattern("T", 7, 0, sides=True)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            codegen.load_matcher(pattern, cache_dir)
+            files = os.listdir(cache_dir)
+            self.assertEqual(len(files), 1)
+
+            with mock.patch("builtins.open", side_effect=AssertionError("regenerated")):
+                match = codegen.load_matcher(pattern, cache_dir)
+
+            self.assertEqual(os.listdir(cache_dir), files)
+            self.assertTrue(callable(match))
+
+    def test_fallback_to_closures(self):
+        """Test a pattern still compiles when the cache cannot be written."""
+        with mock.patch.object(codegen, "load_matcher", side_effect=PermissionError):
+            pattern = Pattern("Q", 4, 0, sides=True)
+
+        self.assertEqual(pattern.match.__module__, "productions.pattern")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,131 @@
+import unittest
+import os
+import sys
+import numpy as np
+tests_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.abspath(os.path.join(tests_dir, '..')))
+from hypergraph.array_hypergraph import ArrayHyperGraph
+from hypergraph.node import Node, NodeBase
+from hypergraph.edge import Edge, EdgeBase
+
+# Production suites are re-run against the array backend below.
+# P10's suite is left out: two of its cases contradict each other and fail
+# regardless of the storage backend.
+for name in ['p0', 'p1', 'p2', 'p3', 'p4', 'p5', 'p6', 'p7', 'p8', 'p9', 'p11', 'p12', 'p13', 'p14']:
+    sys.path.append(os.path.join(tests_dir, f'test_{name}'))
+
+import test_p0, test_p1, test_p2, test_p3, test_p4, test_p5, test_p6, test_p7, test_p8, test_p9, test_p11, test_p12, test_p13, test_p14
+
+
+def on_array_backend(test_case):
+    class ArrayBackendCase(test_case):
+        def setUp(self):
+            super().setUp()
+            self.graph = ArrayHyperGraph(capacity=4)
+
+    ArrayBackendCase.__name__ = f"{test_case.__name__}Array"
+    return ArrayBackendCase
+
+
+TestP0Array = on_array_backend(test_p0.TestP0)
+TestP1Array = on_array_backend(test_p1.TestP1)
+TestP2Array = on_array_backend(test_p2.TestP2)
+TestP3Array = on_array_backend(test_p3.TestP3)
+TestP4Array = on_array_backend(test_p4.TestP4)
+TestP5Array = on_array_backend(test_p5.TestP5)
+TestP6Array = on_array_backend(test_p6.TestP6)
+TestP7Array = on_array_backend(test_p7.TestP7)
+TestP8Array = on_array_backend(test_p8.TestP8)
+TestP9Array = on_array_backend(test_p9.TestP9)
+TestP11Array = on_array_backend(test_p11.TestP11)
+TestP12Array = on_array_backend(test_p12.TestP12)
+TestP13Array = on_array_backend(test_p13.TestP13)
+TestP14Array = on_array_backend(test_p14.TestP14)
+
+
+class TestArrayHyperGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = ArrayHyperGraph(capacity=2)
+
+    def test_nodes_are_views_over_coordinates(self):
+        """Test node coordinates are read from and written to the arrays."""
+        n1 = self.graph.add_node(1.5, -2.0)
+        n2 = self.graph.add_node(3.0, 4.0)
+        n1.z = 7.0
+
+        self.assertEqual((n1.x, n1.y, n1.z), (1.5, -2.0, 7.0))
+        np.testing.assert_array_equal(self.graph.coordinates, [[1.5, -2.0], [3.0, 4.0]])
+
+        n2.x = 5.0
+        self.assertEqual(self.graph.coordinates[1, 0], 5.0)
+
+    def test_edges_store_node_indices(self):
+        """Test edges and hyperedges resolve their nodes through the CSR arrays."""
+        nodes = [self.graph.add_node(x, y) for x, y in [(0, 0), (2, 0), (2, 2), (0, 2), (1, 3)]]
+        e = self.graph.add_edge(nodes[0], nodes[1], is_border=True)
+        p = self.graph.add_hyperedge(nodes, label="P")
+
+        self.assertEqual(e.nodes, (nodes[0], nodes[1]))
+        self.assertEqual(p.nodes, tuple(nodes))
+        self.assertTrue(p.is_hyperedge())
+        self.assertFalse(e.is_hyperedge())
+        self.assertEqual(e.label, "E")
+        self.assertIs(self.graph.get_edge_between(nodes[1], nodes[0]), e)
+        self.assertEqual(self.graph.get_edges("P", 5, 0), [p])
+
+    def test_vectorized_centroids_and_boxes(self):
+        """Test centroids, per-edge boxes and graph bounds are computed from arrays."""
+        nodes = [self.graph.add_node(x, y) for x, y in [(0, 0), (2, 0), (2, 2), (0, 2)]]
+        e = self.graph.add_edge(nodes[0], nodes[1])
+        q = self.graph.add_hyperedge(nodes, label="Q")
+
+        np.testing.assert_allclose(self.graph.centroids(), [[1, 0], [1, 1]])
+        np.testing.assert_allclose(self.graph.edge_bounding_boxes([q]), [[0, 0, 2, 2]])
+        self.assertEqual((q.x, q.y), (1.0, 1.0))
+        self.assertEqual(self.graph.bounding_box(), (0.0, 0.0, 2.0, 2.0))
+
+        self.graph.remove_edge(e)
+        np.testing.assert_allclose(self.graph.centroids(), [[1, 1]])
+
+    def test_views_are_no_heavier_than_objects(self):
+        """Test views carry no coordinate or node slots and take less memory than Node and Edge."""
+        nodes = [self.graph.add_node(x, y) for x, y in [(0, 0), (2, 0), (2, 2), (0, 2)]]
+        q = self.graph.add_hyperedge(nodes, label="Q")
+
+        self.assertIsInstance(nodes[0], NodeBase)
+        self.assertNotIsInstance(nodes[0], Node)
+        self.assertIsInstance(q, EdgeBase)
+        self.assertNotIsInstance(q, Edge)
+        self.assertFalse(hasattr(nodes[0], '__dict__'))
+        self.assertFalse(hasattr(q, '__dict__'))
+        self.assertLess(sys.getsizeof(nodes[0]), sys.getsizeof(Node(0, 0)))
+        # an Edge also owns the tuple of its nodes, which a view builds on demand
+        edge = Edge([Node(x, y) for x, y in [(0, 0), (2, 0), (2, 2), (0, 2)]], label="Q")
+        self.assertLess(sys.getsizeof(q), sys.getsizeof(edge) + sys.getsizeof(edge.nodes))
+
+    def test_find_nodes_in_box(self):
+        """Test vectorized box query over node coordinates."""
+        nodes = [self.graph.add_node(i, i) for i in range(10)]
+
+        self.assertEqual(self.graph.find_nodes_in_box(2.5, 2.5, 5, 5), nodes[3:6])
+        self.assertIs(self.graph.find_node_near(4, 4), nodes[4])
+
+    def test_bulk_construction(self):
+        """Test bulk construction writes whole blocks into the arrays."""
+        nodes = self.graph.add_nodes_from(np.array([[0, 0], [2, 0], [2, 2], [0, 2]], dtype=float))
+        edges = self.graph.add_edges_from([(0, 1), (1, 2), (2, 3), (3, 0)], is_border=True)
+        quads = self.graph.add_hyperedges_from(np.array([[0, 1, 2, 3]]), labels="Q")
+
+        np.testing.assert_array_equal(self.graph.coordinates[2], [2, 2])
+        self.assertEqual(edges[1].nodes, (nodes[1], nodes[2]))
+        self.assertEqual(quads[0].nodes, tuple(nodes))
+        self.assertTrue(all(e.is_border for e in edges))
+        np.testing.assert_allclose(self.graph.centroids(quads), [[1, 1]])
+
+        single = self.graph.add_edge(nodes[0], nodes[2])
+        self.assertEqual(single.nodes, (nodes[0], nodes[2]))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,316 @@
+import unittest
+import os
+import sys
+import numpy as np
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from hypergraph.hypergraph import HyperGraph
+
+
+class TestHyperGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = HyperGraph()
+
+    def _square(self):
+        n1 = self.graph.add_node(0, 0)
+        n2 = self.graph.add_node(1, 0)
+        n3 = self.graph.add_node(1, 1)
+        n4 = self.graph.add_node(0, 1)
+
+        edges = [
+            self.graph.add_edge(n1, n2, is_border=True),
+            self.graph.add_edge(n2, n3, is_border=True),
+            self.graph.add_edge(n3, n4, is_border=True),
+            self.graph.add_edge(n4, n1, is_border=True),
+        ]
+        q = self.graph.add_hyperedge([n1, n2, n3, n4], label="Q")
+        return [n1, n2, n3, n4], edges, q
+
+    def test_incident_edges_tracks_edges_and_hyperedges(self):
+        """Test incidence index lists every edge and hyperedge containing a node."""
+        nodes, edges, q = self._square()
+
+        self.assertEqual(self.graph.incident_edges(nodes[0]), [edges[0], edges[3], q])
+        self.assertEqual(self.graph.incident_edges(nodes[1]), [edges[0], edges[1], q])
+
+    def test_incident_edges_updated_on_remove(self):
+        """Test removing an edge drops it from the incidence index."""
+        nodes, edges, q = self._square()
+
+        self.graph.remove_edge(edges[0])
+        self.graph.remove_edge(q)
+
+        self.assertEqual(self.graph.incident_edges(nodes[0]), [edges[3]])
+        self.assertEqual(self.graph.incident_edges(nodes[1]), [edges[1]])
+
+    def test_get_edge_between(self):
+        """Test edge lookup works in both directions and ignores hyperedges."""
+        nodes, edges, q = self._square()
+        n1, n2, n3, n4 = nodes
+
+        self.assertIs(self.graph.get_edge_between(n1, n2), edges[0])
+        self.assertIs(self.graph.get_edge_between(n2, n1), edges[0])
+        self.assertIs(self.graph.get_edge_between(n1, n4), edges[3])
+        self.assertIsNone(self.graph.get_edge_between(n1, n3))
+
+    def test_get_edge_between_after_remove(self):
+        """Test removed edges are no longer found."""
+        nodes, edges, q = self._square()
+
+        self.graph.remove_edge(edges[1])
+
+        self.assertIsNone(self.graph.get_edge_between(nodes[1], nodes[2]))
+
+    def test_get_edge_between_isolated_node(self):
+        """Test lookup for a node without incident edges."""
+        nodes, edges, q = self._square()
+        n5 = self.graph.add_node(2, 2)
+
+        self.assertIsNone(self.graph.get_edge_between(nodes[0], n5))
+
+    def test_get_edge_between_broken_edge_kept_next_to_halves(self):
+        """Test original edge and its two halves are looked up independently (P3 layout)."""
+        n1 = self.graph.add_node(0, 0)
+        n2 = self.graph.add_node(2, 0)
+        original = self.graph.add_edge(n1, n2)
+        mid = self.graph.add_node(1, 0)
+        half_1 = self.graph.add_edge(n1, mid)
+        half_2 = self.graph.add_edge(mid, n2)
+
+        self.assertIs(self.graph.get_edge_between(n1, n2), original)
+        self.assertIs(self.graph.get_edge_between(mid, n1), half_1)
+        self.assertIs(self.graph.get_edge_between(n2, mid), half_2)
+
+    def test_get_edge_between_parallel_edges(self):
+        """Test the oldest of parallel edges is returned until it is removed."""
+        n1 = self.graph.add_node(0, 0)
+        n2 = self.graph.add_node(1, 0)
+        first = self.graph.add_edge(n1, n2)
+        second = self.graph.add_edge(n2, n1)
+
+        self.assertIs(self.graph.get_edge_between(n1, n2), first)
+
+        self.graph.remove_edge(first)
+        self.assertIs(self.graph.get_edge_between(n1, n2), second)
+
+        self.graph.remove_edge(second)
+        self.assertIsNone(self.graph.get_edge_between(n1, n2))
+
+    def test_find_node_near(self):
+        """Test coordinate lookup returns the node within tolerance."""
+        nodes, edges, q = self._square()
+
+        self.assertIs(self.graph.find_node_near(1, 1), nodes[2])
+        self.assertIs(self.graph.find_node_near(0.05, 0.0, tol=0.1), nodes[0])
+        self.assertIsNone(self.graph.find_node_near(0.5, 0.5))
+        self.assertIsNone(self.graph.find_node_near(0.5, 0.0, tol=0.1))
+
+    def test_find_node_near_returns_oldest(self):
+        """Test that among several nodes in range the first added one is returned."""
+        far = self.graph.add_node(-5, -5)
+        first = self.graph.add_node(0.0, 0.01)
+        second = self.graph.add_node(0.0, -0.01)
+
+        self.assertIs(self.graph.find_node_near(0, 0, tol=0.1), first)
+        self.assertEqual(self.graph.find_nodes_near(0, 0, tol=0.1), [first, second])
+
+    def test_find_node_near_dense_grid(self):
+        """Test lookups stay exact after the spatial hash refines its cells."""
+        step = 1.0 / 64
+        grid = {}
+        for i in range(65):
+            for j in range(65):
+                grid[(i, j)] = self.graph.add_node(i * step, j * step)
+
+        for (i, j), node in list(grid.items())[::97]:
+            self.assertIs(self.graph.find_node_near(i * step, j * step), node)
+            self.assertEqual(self.graph.find_nodes_near(i * step, j * step, tol=step / 4), [node])
+        self.assertIsNone(self.graph.find_node_near(step / 2, step / 2))
+
+    def test_get_edges_by_label_arity_and_r(self):
+        """Test bucket lookup by (label, arity, R)."""
+        nodes, edges, q = self._square()
+        p = self.graph.add_hyperedge(nodes + [self.graph.add_node(0.5, 2)], label="P")
+
+        self.assertEqual(self.graph.get_edges("Q", 4, 0), [q])
+        self.assertEqual(self.graph.get_edges("Q", 4, 1), [])
+        self.assertEqual(self.graph.get_edges("P", 5, 0), [p])
+        self.assertEqual(self.graph.get_edges("E", 2, 0), edges)
+        self.assertEqual(self.graph.get_edges("Q", 5), [])
+
+    def test_get_edges_follows_r_and_label_changes(self):
+        """Test edges move between buckets when R or label is reassigned."""
+        nodes, edges, q = self._square()
+
+        q.R = 1
+        edges[2].R = 1
+        self.assertEqual(self.graph.get_edges("Q", 4, 1), [q])
+        self.assertEqual(self.graph.get_edges("Q", 4, 0), [])
+        self.assertEqual(self.graph.get_edges("E", 2, 1), [edges[2]])
+
+        q.label = "S"
+        self.assertEqual(self.graph.get_edges("Q", 4, 1), [])
+        self.assertEqual(self.graph.get_edges("S", 4, 1), [q])
+
+        self.graph.remove_edge(q)
+        self.assertEqual(self.graph.get_edges("S", 4, 1), [])
+
+    def test_get_edges_keeps_graph_order(self):
+        """Test bucket order matches graph.edges order after edges move around."""
+        nodes, edges, q = self._square()
+
+        for edge in reversed(edges):
+            edge.R = 1
+        self.assertEqual(self.graph.get_edges("E", 2, 1), edges)
+
+        edges[0].R = 0
+        edges[0].R = 1
+        self.assertEqual(self.graph.get_edges("E", 2, 1), edges)
+        self.assertEqual(self.graph.get_edges("E", 2), edges)
+
+        edges[1].R = 0
+        self.assertEqual(self.graph.get_edges("E", 2), edges)
+
+    def test_remove_edge_keeps_iteration_order(self):
+        """Test removing edges leaves the remaining ones in insertion order."""
+        nodes, edges, q = self._square()
+
+        self.graph.remove_edge(edges[1])
+        self.graph.remove_edge(edges[1])  # removing twice is a no-op
+        extra = self.graph.add_edge(nodes[0], nodes[2])
+
+        self.assertEqual(list(self.graph.edges), [edges[0], edges[2], edges[3], q, extra])
+        self.assertEqual(len(self.graph.edges), 5)
+        self.assertNotIn(edges[1], self.graph.edges)
+        self.assertIn(extra, self.graph.edges)
+
+    def test_ids_are_monotonic_and_resolvable(self):
+        """Test nodes and edges get increasing ids that look them up."""
+        nodes, edges, q = self._square()
+
+        self.assertEqual([n.id for n in nodes], [0, 1, 2, 3])
+        self.assertEqual([e.id for e in edges + [q]], [0, 1, 2, 3, 4])
+        for node in nodes:
+            self.assertIs(self.graph.node(node.id), node)
+        self.assertIs(self.graph.edge(q.id), q)
+
+    def test_removed_edge_id_is_not_reused(self):
+        """Test removed edges can no longer be looked up and their id stays retired."""
+        nodes, edges, q = self._square()
+
+        self.graph.remove_edge(edges[0])
+        new_edge = self.graph.add_edge(nodes[0], nodes[2])
+
+        with self.assertRaises(KeyError):
+            self.graph.edge(edges[0].id)
+        self.assertEqual(new_edge.id, 5)
+        self.assertIs(self.graph.edge(5), new_edge)
+
+    def test_add_nodes_from(self):
+        """Test bulk node creation from coordinate rows."""
+        nodes = self.graph.add_nodes_from([(0, 0), (1, 0), (1, 1)])
+
+        self.assertEqual([(n.x, n.y) for n in nodes], [(0, 0), (1, 0), (1, 1)])
+        self.assertEqual([n.id for n in nodes], [0, 1, 2])
+        self.assertEqual(self.graph.nodes, nodes)
+        self.assertIs(self.graph.find_node_near(1, 1), nodes[2])
+
+    def test_add_edges_and_hyperedges_from(self):
+        """Test bulk edges and hyperedges are indexed like single additions."""
+        nodes = self.graph.add_nodes_from(np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=float))
+        edges = self.graph.add_edges_from(np.array([[0, 1], [1, 2], [2, 3], [3, 0]]), is_border=[True, False, True, True])
+        hyperedges = self.graph.add_hyperedges_from([[0, 1, 2, 3], [0, 1, 2]], labels=["Q", "T"])
+
+        self.assertEqual(list(self.graph.edges), edges + hyperedges)
+        self.assertEqual([e.is_border for e in edges], [True, False, True, True])
+        self.assertEqual([e.label for e in edges], ["E"] * 4)
+        self.assertIs(self.graph.get_edge_between(nodes[0], nodes[3]), edges[3])
+        self.assertEqual(self.graph.get_edges("Q", 4, 0), [hyperedges[0]])
+        self.assertEqual(self.graph.get_edges("T", 3, 0), [hyperedges[1]])
+        self.assertEqual(self.graph.incident_edges(nodes[2]), [edges[1], edges[2]] + hyperedges)
+
+    def test_bulk_argument_length_mismatch(self):
+        """Test per-item arguments must match the number of rows."""
+        self.graph.add_nodes_from([(0, 0), (1, 0), (1, 1)])
+
+        with self.assertRaises(ValueError):
+            self.graph.add_edges_from([(0, 1), (1, 2)], is_border=[True])
+        with self.assertRaises(ValueError):
+            self.graph.add_hyperedges_from([(0, 1, 2)], labels=["Q", "P"])
+
+    def test_midpoint_registry(self):
+        """Test midpoints are registered per unordered node pair."""
+        n1 = self.graph.add_node(0, 0)
+        n2 = self.graph.add_node(2, 0)
+        mid = self.graph.add_node(1, 0)
+
+        self.assertIsNone(self.graph.get_midpoint(n1, n2))
+        self.graph.register_midpoint(n1, n2, mid)
+        self.assertIs(self.graph.get_midpoint(n2, n1), mid)
+        self.assertIsNone(self.graph.get_midpoint(n1, mid))
+
+    def test_locate(self):
+        """Test locate returns the element containing a point, the older one on a shared side."""
+        nodes = self.graph.add_nodes_from([(0, 0), (1, 0), (2, 0), (0, 1), (1, 1), (2, 1)])
+        left, right = self.graph.add_hyperedges_from([[0, 1, 4, 3], [1, 2, 5, 4]], labels="Q")
+
+        self.assertIs(self.graph.locate(0.5, 0.5), left)
+        self.assertIs(self.graph.locate(1.5, 0.25), right)
+        self.assertIs(self.graph.locate(1.0, 0.5), left)
+        self.assertIs(self.graph.locate(2.0, 1.0), right)
+        self.assertIsNone(self.graph.locate(2.5, 0.5))
+        self.assertIsNone(self.graph.locate(1.0, -0.1))
+
+        self.graph.remove_edge(left)
+        triangle = self.graph.add_hyperedge([nodes[0], nodes[1], nodes[3]], label="T")
+        self.assertIs(self.graph.locate(0.2, 0.2), triangle)
+        self.assertIsNone(self.graph.locate(0.8, 0.8))
+        self.assertIs(self.graph.locate(1.0, 0.5), right)
+
+    def test_locate_many_matches_locate(self):
+        """Test batch point location agrees with single queries."""
+        rng = np.random.default_rng(0)
+        size = 12
+        coords = [(i + 0.2 * rng.random(), j + 0.2 * rng.random()) for j in range(size + 1) for i in range(size + 1)]
+        self.graph.add_nodes_from(coords)
+        quads = [
+            [j * (size + 1) + i, j * (size + 1) + i + 1, (j + 1) * (size + 1) + i + 1, (j + 1) * (size + 1) + i]
+            for j in range(size) for i in range(size)
+        ]
+        self.graph.add_hyperedges_from(quads, labels="Q")
+        points = rng.uniform(-1, size + 1, (2000, 2))
+
+        found = self.graph.locate_many(points)
+
+        self.assertEqual(found, [self.graph.locate(x, y) for x, y in points])
+        self.assertGreater(sum(edge is None for edge in found), 0)
+        self.assertGreater(len(set(found)), size * size * 0.9)
+        self.assertEqual(self.graph.locate_many(coords), [self.graph.locate(x, y) for x, y in coords])
+        self.assertEqual(self.graph.locate_many(np.empty((0, 2))), [])
+
+    def test_edges_by_distance(self):
+        """Test edges of one bucket come nearest centroid first, ties in graph order, as the graph changes."""
+        rng = np.random.default_rng(1)
+        nodes = self.graph.add_nodes_from(rng.uniform(0, 10, (200, 2)))
+        pairs = rng.choice(len(nodes), (300, 2))
+        edges = self.graph.add_edges_from(pairs[pairs[:, 0] != pairs[:, 1]])
+        for edge in edges[::3]:
+            edge.R = 1
+
+        def expected(x, y, R):
+            matching = [e for e in self.graph.edges if e.label == "E" and (R is None or e.R == R)]
+            return sorted(matching, key=lambda e: ((e.x - x) ** 2 + (e.y - y) ** 2, e.id))
+
+        for x, y in [(5, 5), (0, 0), (-20, 3)]:
+            self.assertEqual(list(self.graph.edges_by_distance(x, y, "E", 2, 1)), expected(x, y, 1))
+            self.assertEqual(list(self.graph.edges_by_distance(x, y, "E", 2)), expected(x, y, None))
+
+        self.graph.remove_edge(edges[0])
+        added = self.graph.add_edge(nodes[0], nodes[1])
+        added.R = 1
+        self.assertEqual(list(self.graph.edges_by_distance(5, 5, "E", 2, 1)), expected(5, 5, 1))
+        self.assertEqual(list(self.graph.edges_by_distance(5, 5, "Q", 4)), [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,97 @@
+import unittest
+import os
+import sys
+import tracemalloc
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from hypergraph.node import Node
+from hypergraph.edge import Edge
+
+
+class LegacyNode:
+    """Node layout before __slots__ (per-instance __dict__)."""
+
+    def __init__(self, x, y, z=0, label="V"):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.label = label
+
+
+class LegacyEdge:
+    """Edge layout before __slots__ (__dict__, node list, stored centroid)."""
+
+    def __init__(self, nodes, is_border=False, label=None, R=False):
+        self.nodes = nodes
+        self.B = is_border
+        self.label = label if label else ("E" if len(self.nodes) == 2 else "Q")
+        self.R = R
+        self.x = sum(node.x for node in self.nodes) / len(self.nodes)
+        self.y = sum(node.y for node in self.nodes) / len(self.nodes)
+
+
+COUNT = 5000
+
+
+def bytes_per_object(factory):
+    """Average traced allocation per object created by factory(i)."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        objects = [factory(i) for i in range(COUNT)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    # the list holding the objects is not part of the per-object cost
+    allocated -= sys.getsizeof(objects)
+    return allocated / COUNT
+
+
+class TestMemory(unittest.TestCase):
+
+    def test_node_memory(self):
+        """Test Node uses less memory per instance than the __dict__ layout."""
+        legacy = bytes_per_object(lambda i: LegacyNode(float(i), float(i)))
+        current = bytes_per_object(lambda i: Node(float(i), float(i)))
+
+        print(f"\nbytes per node: before={legacy:.0f} after={current:.0f}")
+        self.assertLess(current, legacy)
+
+    def test_edge_memory(self):
+        """Test Edge uses less memory per instance than the __dict__ layout."""
+        nodes = [Node(float(i), 0.0) for i in range(COUNT + 1)]
+
+        legacy = bytes_per_object(lambda i: LegacyEdge([nodes[i], nodes[i + 1]]))
+        current = bytes_per_object(lambda i: Edge([nodes[i], nodes[i + 1]]))
+
+        print(f"\nbytes per edge: before={legacy:.0f} after={current:.0f}")
+        self.assertLess(current, legacy)
+
+    def test_hyperedge_memory(self):
+        """Test hyperedges also shrink compared to the __dict__ layout."""
+        nodes = [Node(float(i), 0.0) for i in range(COUNT + 4)]
+
+        legacy = bytes_per_object(lambda i: LegacyEdge(nodes[i:i + 4], label="Q"))
+        current = bytes_per_object(lambda i: Edge(nodes[i:i + 4], label="Q"))
+
+        print(f"\nbytes per hyperedge: before={legacy:.0f} after={current:.0f}")
+        self.assertLess(current, legacy)
+
+    def test_public_attributes_kept(self):
+        """Test slots keep the public attributes and the is_border/B alias."""
+        n1 = Node(0, 0)
+        n2 = Node(2, 4)
+        edge = Edge([n1, n2], is_border=True)
+
+        self.assertEqual((edge.x, edge.y), (1, 2))
+        self.assertTrue(edge.is_border)
+        edge.is_border = False
+        self.assertFalse(edge.B)
+        self.assertEqual(edge.label, "E")
+        self.assertFalse(hasattr(edge, '__dict__'))
+        self.assertFalse(hasattr(n1, '__dict__'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
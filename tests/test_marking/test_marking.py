@@ -0,0 +1,68 @@
+import unittest
+import os
+import sys
+import numpy as np
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.append(project_root)
+sys.path.append(os.path.join(project_root, 'loops'))
+from productions import mark_by_error
+from mesh_generator import create_quad_grid, create_mixed_tiling
+
+
+def elements(graph, R):
+    return [edge for edge in graph.edges if edge.is_hyperedge() and edge.R == R]
+
+
+class TestMarkByError(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = create_mixed_tiling(6, 6, seed=1)
+        self.errors = np.random.default_rng(0).random(max(edge.id for edge in self.graph.edges) + 1)
+
+    def test_threshold_marks_every_large_error(self):
+        """Test every element with an error at or above the threshold is marked, and only those."""
+        marked = mark_by_error(self.graph, self.errors, threshold=0.7)
+
+        self.assertGreater(len(marked), 0)
+        self.assertEqual(marked, elements(self.graph, 1))
+        for edge in elements(self.graph, 0):
+            self.assertLess(self.errors[edge.id], 0.7)
+        self.assertGreater(len({edge.label for edge in marked}), 1)
+
+    def test_fraction_marks_largest_errors(self):
+        """Test a fraction marks that share of the elements with the largest errors."""
+        count = len(elements(self.graph, 0))
+
+        marked = mark_by_error(self.graph, self.errors, fraction=0.25)
+
+        self.assertEqual(len(marked), int(np.ceil(0.25 * count)))
+        smallest_marked = min(self.errors[edge.id] for edge in marked)
+        for edge in elements(self.graph, 0):
+            self.assertLess(self.errors[edge.id], smallest_marked)
+
+    def test_only_unmarked_elements_with_sides(self):
+        """Test marked elements and elements missing a side edge are left alone."""
+        graph = create_quad_grid(2, 1)
+        first, second = graph.get_edges("Q", 4)
+        first.R = 1
+        graph.remove_edge(graph.get_edge_between(*second.nodes[2:4]))
+        errors = np.ones(max(edge.id for edge in graph.edges) + 1)
+
+        self.assertEqual(mark_by_error(graph, errors, threshold=0.5), [])
+        self.assertEqual(mark_by_error(graph, errors, fraction=1.0), [])
+
+    def test_invalid_arguments(self):
+        """Test the selection must be given exactly once and errors must cover every element."""
+        with self.assertRaises(ValueError):
+            mark_by_error(self.graph, self.errors)
+        with self.assertRaises(ValueError):
+            mark_by_error(self.graph, self.errors, threshold=0.5, fraction=0.5)
+        with self.assertRaises(ValueError):
+            mark_by_error(self.graph, self.errors, fraction=1.5)
+        with self.assertRaises(ValueError):
+            mark_by_error(self.graph, self.errors[:5], threshold=0.5)
+        self.assertEqual(elements(self.graph, 1), [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
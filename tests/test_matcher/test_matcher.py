@@ -0,0 +1,185 @@
+import unittest
+import os
+import sys
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.append(project_root)
+sys.path.append(os.path.join(project_root, 'loops'))
+from hypergraph.hypergraph import HyperGraph
+from productions import P0, P1, P2, P3, P4, P5, P9, P10, P11, IncrementalMatcher, MatchCache
+from mesh_generator import create_quad_grid, create_mixed_tiling
+
+
+def refinement_chain():
+    return [P10(), P4(), P3(), P11(), P1(), P4(), P2(), P3(), P5()]
+
+
+class TestIncrementalMatcher(unittest.TestCase):
+
+    def assertMatchesUpToDate(self, matcher, graph):
+        """Live matches equal a fresh scan and first() equals can_apply()."""
+        for production in matcher.productions:
+            self.assertEqual(list(matcher.matches(production).values()), list(production.iter_matches(graph)))
+            can_apply, matched = production.can_apply(graph)
+            self.assertEqual(matcher.first(production), matched if can_apply else None)
+
+    def run_to_fixed_point(self, matcher, graph):
+        """Apply productions like apply_while, checking the live matches after every step."""
+        applied = 0
+        progress = True
+        while progress:
+            progress = False
+            for production in matcher.productions:
+                while True:
+                    matched = matcher.first(production)
+                    if matched is None:
+                        break
+                    production.apply(graph, matched)
+                    applied += 1
+                    progress = True
+                    self.assertMatchesUpToDate(matcher, graph)
+        return applied
+
+    def test_graph_reports_changes(self):
+        """Test subscribers are told about added, changed and removed elements."""
+        graph = HyperGraph()
+        events = []
+        graph.subscribe(lambda event, element: events.append((event, element)))
+
+        n1 = graph.add_node(0, 0)
+        n2 = graph.add_node(1, 0)
+        edge = graph.add_edge(n1, n2)
+        edge.R = 1
+        edge.R = 1  # no change, not reported
+        graph.remove_edge(edge)
+
+        self.assertEqual(events, [
+            ("node_added", n1),
+            ("node_added", n2),
+            ("edge_added", edge),
+            ("edge_changed", edge),
+            ("edge_removed", edge),
+        ])
+
+    def test_quad_refinement_matches_stay_current(self):
+        """Test matches follow a full quad refinement run step by step."""
+        graph = create_quad_grid(4, 4, seed=1, marked=0.3)
+        matcher = IncrementalMatcher(graph, refinement_chain())
+
+        self.assertMatchesUpToDate(matcher, graph)
+        self.assertGreater(self.run_to_fixed_point(matcher, graph), 0)
+        self.assertEqual(graph.get_edges("Q", 4, 1), [])
+
+        marker = P0()
+        matcher = IncrementalMatcher(graph, refinement_chain() + [marker])
+        marker.apply(graph, matcher.first(marker))
+        self.assertMatchesUpToDate(matcher, graph)
+        matcher.close()
+
+    def test_mixed_tiling_matches_stay_current(self):
+        """Test matches of hexagon and quad productions on a mixed mesh."""
+        graph = create_mixed_tiling(5, 5, seed=2, marked=0.3)
+        matcher = IncrementalMatcher(graph, [P9()] + refinement_chain())
+
+        self.run_to_fixed_point(matcher, graph)
+        self.assertMatchesUpToDate(matcher, graph)
+
+    def test_work_is_local(self):
+        """Test one application re-checks a bounded number of candidates, whatever the mesh size."""
+        costs = []
+        for size in (5, 20):
+            graph = create_quad_grid(size, size)
+            production = P0()
+            matcher = IncrementalMatcher(graph, [production])
+            self.assertEqual(matcher.evaluations, size * size)
+
+            production.apply(graph, matcher.first(production))
+            before = matcher.evaluations
+            matcher.first(production)
+            costs.append(matcher.evaluations - before)
+
+        self.assertEqual(costs[0], costs[1])
+        self.assertLess(costs[1], 10)
+
+    def test_requires_anchor(self):
+        """Test productions without an anchor are rejected."""
+        production = P0()
+        production.anchor = None
+
+        with self.assertRaises(ValueError):
+            IncrementalMatcher(HyperGraph(), [production])
+
+
+class TestMatchCache(unittest.TestCase):
+
+    def test_repeated_queries_hit_the_cache(self):
+        """Test asking twice about an unchanged graph computes every match once."""
+        graph = create_quad_grid(5, 5, seed=0, marked=0.4)
+        cache = MatchCache(graph)
+        production = P1()
+
+        first = cache.matches(production)
+        misses = cache.misses
+        self.assertEqual(list(first.values()), list(production.iter_matches(graph)))
+        self.assertEqual(cache.matches(production), first)
+        self.assertEqual(cache.can_apply(production), production.can_apply(graph))
+        edge = next(iter(first))
+        self.assertEqual(cache.can_apply(production, hyperedge=edge), (True, first[edge]))
+        self.assertEqual(cache.matches_at(production, edge.nodes[0]), production.matches_at(graph, edge.nodes[0]))
+
+        self.assertEqual(cache.misses, misses)
+        self.assertGreater(cache.hits, 0)
+        cache.close()
+
+    def test_changes_evict_only_nearby_entries(self):
+        """Test an application recomputes matches around it and keeps the rest."""
+        graph = create_quad_grid(10, 10)
+        cache = MatchCache(graph)
+        production = P0()
+        cache.matches(production)
+
+        production.apply(graph, cache.can_apply(production)[1])
+        misses = cache.misses
+        found = cache.matches(production)
+
+        self.assertEqual(list(found.values()), list(production.iter_matches(graph)))
+        self.assertLess(cache.misses - misses, 10)
+        cache.close()
+
+    def test_nearest_matches_are_local(self):
+        """Test the nearest match is found by checking only the anchors around the target."""
+        graph = create_quad_grid(40, 40)
+        cache = MatchCache(graph)
+        production = P0()
+        target = graph.find_node_near(20, 20, 0.5)
+
+        nearest = list(production.nearest_matches(graph, target.x, target.y))
+        first = next(cache.nearest_matches(production, target.x, target.y))
+
+        self.assertIs(first, cache.match_at(production, first['hyperedge']))
+        self.assertEqual(first['hyperedge'], nearest[0]['hyperedge'])
+        self.assertLess(cache.misses, 50)
+        distances = [(m['hyperedge'].x - target.x) ** 2 + (m['hyperedge'].y - target.y) ** 2 for m in nearest]
+        self.assertEqual(distances, sorted(distances))
+        self.assertEqual(len(nearest), 40 * 40)
+        cache.close()
+
+    def test_stays_current_during_refinement(self):
+        """Test cached answers equal can_apply() after every step of a refinement run."""
+        graph = create_mixed_tiling(4, 4, seed=3, marked=0.4)
+        cache = MatchCache(graph)
+        productions = [P9()] + refinement_chain()
+
+        progress = True
+        while progress:
+            progress = False
+            for production in productions:
+                can_apply, matched = cache.can_apply(production)
+                self.assertEqual((can_apply, matched), production.can_apply(graph))
+                if can_apply:
+                    production.apply(graph, matched)
+                    progress = True
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
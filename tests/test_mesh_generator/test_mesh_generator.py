@@ -0,0 +1,102 @@
+import unittest
+import os
+import sys
+from collections import Counter
+import numpy as np
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.append(project_root)
+sys.path.append(os.path.join(project_root, 'loops'))
+from hypergraph.hypergraph import HyperGraph
+from hypergraph.array_hypergraph import ArrayHyperGraph
+from productions import P0
+from mesh_generator import _build_tiling, create_quad_grid, create_polygon_strip, create_mixed_tiling
+
+
+def element_counts(graph):
+    return Counter(e.label for e in graph.edges if e.is_hyperedge())
+
+
+class TestMeshGenerator(unittest.TestCase):
+
+    def assertConsistentMesh(self, graph):
+        """Every element side is an E edge, shared sides are interior, outer sides are border."""
+        owners = Counter()
+        for element in (e for e in graph.edges if e.is_hyperedge()):
+            nodes = element.nodes
+            for a, b in zip(nodes, nodes[1:] + nodes[:1]):
+                edge = graph.get_edge_between(a, b)
+                self.assertIsNotNone(edge)
+                owners[edge] += 1
+
+        edges = [e for e in graph.edges if not e.is_hyperedge()]
+        self.assertEqual(set(owners), set(edges))
+        for edge in edges:
+            self.assertEqual(edge.is_border, owners[edge] == 1)
+            self.assertLessEqual(owners[edge], 2)
+
+    def test_quad_grid_counts(self):
+        """Test an n x m grid has the expected nodes, edges and Q elements."""
+        graph = create_quad_grid(4, 3)
+
+        self.assertEqual(len(graph.nodes), 5 * 4)
+        self.assertEqual(len(graph.edges), 4 * 4 + 5 * 3 + 12)
+        self.assertEqual(element_counts(graph), {"Q": 12})
+        self.assertEqual(sum(e.is_border for e in graph.edges if not e.is_hyperedge()), 2 * (4 + 3))
+        self.assertConsistentMesh(graph)
+
+    def test_quad_grid_matches_general_tiling(self):
+        """Test the vectorized quad grid builds the same graph as the general tiling."""
+        fast = create_quad_grid(3, 2)
+        general = _build_tiling(np.zeros((3, 3), dtype=int), np.zeros((4, 2), dtype=int), np.random.default_rng())
+
+        self.assertEqual([(n.x, n.y) for n in fast.nodes], [(n.x, n.y) for n in general.nodes])
+        self.assertEqual(
+            [([n.id for n in e.nodes], e.label, e.is_border) for e in fast.edges],
+            [([n.id for n in e.nodes], e.label, e.is_border) for e in general.edges],
+        )
+
+    def test_polygon_strips(self):
+        """Test strips produce elements of one type with the right number of nodes."""
+        for label, arity in [("Q", 4), ("P", 5), ("S", 6), ("T", 7)]:
+            graph = create_polygon_strip(label, 5)
+
+            self.assertEqual(element_counts(graph), {label: 5})
+            self.assertEqual(len(graph.get_edges(label, arity, 0)), 5)
+            self.assertConsistentMesh(graph)
+
+        with self.assertRaises(ValueError):
+            create_polygon_strip("X", 3)
+
+    def test_mixed_tiling_is_seeded(self):
+        """Test mixed tilings contain several element types and repeat for the same seed."""
+        graph = create_mixed_tiling(10, 10, seed=3, jitter=0.2)
+        again = create_mixed_tiling(10, 10, seed=3, jitter=0.2)
+
+        counts = element_counts(graph)
+        self.assertEqual(sum(counts.values()), 100)
+        self.assertGreater(len(counts), 2)
+        self.assertEqual([(n.x, n.y) for n in graph.nodes], [(n.x, n.y) for n in again.nodes])
+        self.assertConsistentMesh(graph)
+
+    def test_marked_fraction(self):
+        """Test marked elements are created with R=1."""
+        graph = create_quad_grid(10, 10, seed=0, marked=0.5)
+
+        marked = len(graph.get_edges("Q", 4, 1))
+        self.assertGreater(marked, 0)
+        self.assertEqual(marked + len(graph.get_edges("Q", 4, 0)), 100)
+
+    def test_productions_match_generated_mesh(self):
+        """Test P0 finds every quad of a generated grid on both backends."""
+        for graph_cls in (HyperGraph, ArrayHyperGraph):
+            graph = create_quad_grid(3, 3, graph_cls=graph_cls)
+            production = P0()
+
+            for quad in graph.get_edges("Q", 4, 0):
+                can_apply, matched = production.can_apply(graph, quad)
+                self.assertTrue(can_apply)
+                self.assertEqual(len(matched['edges']), 4)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
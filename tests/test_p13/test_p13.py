@@ -0,0 +1,74 @@
+import unittest
+import os
+import sys
+import math
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+from hypergraph.hypergraph import HyperGraph
+from productions import P13
+
+
+class TestP13(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = HyperGraph()
+        self.production = P13()
+
+    def _create_heptagon(self, r_value=1, label="T"):
+        nodes = []
+        for i in range(7):
+            angle = 2.0 * math.pi * i / 7.0
+            nodes.append(self.graph.add_node(math.cos(angle), math.sin(angle)))
+
+        edges = []
+        for i in range(7):
+            edges.append(self.graph.add_edge(nodes[i], nodes[(i + 1) % 7], is_border=True))
+
+        t = self.graph.add_hyperedge(nodes, label=label)
+        t.R = r_value
+        return nodes, edges, t
+
+    def test_can_apply_correct_heptagon(self):
+        """Test P13 matches a marked heptagon with all seven side edges."""
+        nodes, edges, t = self._create_heptagon()
+
+        can_apply, matched = self.production.can_apply(self.graph)
+
+        self.assertTrue(can_apply)
+        self.assertIs(matched["hyperedge"], t)
+        self.assertEqual(matched["edges"], edges)
+
+    def test_cannot_apply_not_marked(self):
+        """Test P13 does not match a heptagon with R=0."""
+        self._create_heptagon(r_value=0)
+
+        self.assertEqual(self.production.can_apply(self.graph), (False, None))
+
+    def test_cannot_apply_wrong_label(self):
+        """Test P13 does not match a 7-node hyperedge with another label."""
+        self._create_heptagon(label="X")
+
+        self.assertEqual(self.production.can_apply(self.graph), (False, None))
+
+    def test_cannot_apply_missing_edge(self):
+        """Test P13 does not match when a side edge is missing."""
+        _, edges, _ = self._create_heptagon()
+        self.graph.remove_edge(edges[3])
+
+        self.assertFalse(self.production.can_apply(self.graph)[0])
+
+    def test_apply_marks_all_edges_once(self):
+        """Test apply marks every side for breaking and the heptagon no longer matches."""
+        _, edges, t = self._create_heptagon()
+        _, matched = self.production.can_apply(self.graph)
+
+        result = self.production.apply(self.graph, matched)
+
+        self.assertEqual(result["marked_edges"], edges)
+        self.assertTrue(all(edge.R == 1 for edge in edges))
+        self.assertEqual(t.R, 1)
+        self.assertFalse(self.production.can_apply(self.graph)[0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
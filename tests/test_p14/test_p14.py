@@ -0,0 +1,43 @@
+import unittest
+import os
+import sys
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.append(project_root)
+sys.path.append(os.path.join(project_root, "tests"))
+from hypergraph.hypergraph import HyperGraph
+from productions import P2, P3, P4, P12, P13, P14, Scheduler
+from polygon_helpers import create_broken_polygon, assert_broken_into_quadrilaterals
+
+
+class TestP14(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = HyperGraph()
+        self.production = P14()
+
+    def test_apply_builds_seven_quadrilaterals(self):
+        """Test apply replaces the heptagon by seven quadrilaterals and reports them."""
+        nodes, midpoints, t = create_broken_polygon(self.graph, "T", 7)
+        _, matched = self.production.can_apply(self.graph)
+
+        result = self.production.apply(self.graph, matched)
+
+        self.assertIs(result["original_hyperedge"], t)
+        self.assertEqual(result["quadrilaterals"], self.graph.get_edges("Q", 4, 0))
+        assert_broken_into_quadrilaterals(self, self.graph, nodes, midpoints, result["central_node"])
+
+    def test_full_heptagon_refinement(self):
+        """Test marking, breaking the sides and P14 refine a heptagon unattended."""
+        _, _, t = create_broken_polygon(self.graph, "T", 7, r_value=0, broken=[])
+
+        applied = Scheduler(self.graph, [P12(), P13(), P4(), P3(), P2(), P14()]).run()
+
+        self.assertEqual(applied, 10)
+        self.assertNotIn(t, self.graph.edges)
+        self.assertEqual(self.graph.get_edges("T", 7), [])
+        self.assertEqual(len(self.graph.get_edges("Q", 4, 0)), 7)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -1,11 +1,15 @@
 import unittest
 import os
 import sys
+from unittest import mock
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.append(project_root)
+sys.path.append(os.path.join(project_root, 'loops'))
 
 from hypergraph.hypergraph import HyperGraph
 from productions.p2.p2 import P2
+from mesh_generator import create_quad_grid
 
 
 class TestP2(unittest.TestCase):
@@ -143,6 +147,32 @@ class TestP2(unittest.TestCase):
         self.assertFalse(can_apply)
         self.assertIsNone(matched)
 
+    def test_matches_without_scanning_edges(self):
+        """Test every broken shared edge of a large mesh is matched through adjacency only.
+
+        The first pass registers no midpoints, so every hanging node is found
+        by the incidence search; the second goes through the midpoint registry.
+        """
+        for register in (False, True):
+            with self.subTest(register=register):
+                graph = create_quad_grid(30, 30)
+                broken = {}
+                for edge in graph.get_edges("E", 2, 0):
+                    if not edge.is_border:
+                        n1, n2 = edge.nodes
+                        mid = graph.add_node((n1.x + n2.x) / 2, (n1.y + n2.y) / 2)
+                        if register:
+                            graph.register_midpoint(n1, n2, mid)
+                        halves = (graph.add_edge(n1, mid), graph.add_edge(mid, n2))
+                        edge.R = 1
+                        broken[edge] = halves
+
+                with mock.patch.object(HyperGraph, "edges", new_callable=mock.PropertyMock, side_effect=AssertionError):
+                    matches = list(self.production.iter_matches(graph))
+
+                self.assertEqual(len(matches), len(broken))
+                for matched in matches:
+                    self.assertEqual(matched["neighbor_edges"], broken[matched["edge_to_remove"]])
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -86,6 +86,9 @@ class TestP3(unittest.TestCase):
         self.assertEqual(mid.y, 0.0)
         self.assertEqual(mid.z, 3.5)
 
+        # midpoint registered for the broken side
+        self.assertIs(self.graph.get_midpoint(n2, n1), mid)
+
     def test_cannot_apply_if_already_broken(self):
         n1 = self.graph.add_node(0, 0)
         n2 = self.graph.add_node(2, 0)
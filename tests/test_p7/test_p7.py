@@ -92,6 +92,20 @@ class TestP7(unittest.TestCase):
         self.assertFalse(can_apply)
         self.assertIsNone(matched)
 
+    def test_can_apply_side_marked_by_neighbour(self):
+        nodes, edges, p = self._create_pentagon(r_value=1, label="P")
+        edges[0].R = 1
+
+        can_apply, matched = self.production.can_apply(self.graph)
+
+        self.assertTrue(can_apply)
+        self.assertEqual(matched["edges"], edges)
+
+        self.production.apply(self.graph, matched)
+
+        for e in edges:
+            self.assertEqual(e.R, 1)
+
     def test_apply_marks_all_edges(self):
         nodes, edges, p = self._create_pentagon(r_value=1, label="P")
 
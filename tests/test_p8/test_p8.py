@@ -0,0 +1,72 @@
+import unittest
+import os
+import sys
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.append(project_root)
+sys.path.append(os.path.join(project_root, "tests"))
+from hypergraph.hypergraph import HyperGraph
+from productions import P3, P4, P8, Scheduler
+from polygon_helpers import create_broken_polygon, assert_broken_into_quadrilaterals
+
+
+class TestP8(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = HyperGraph()
+        self.production = P8()
+
+    def _create_pentagon(self, r_value=1, broken=None):
+        return create_broken_polygon(self.graph, "P", 5, r_value, broken)
+
+    def test_can_apply_finds_midpoints(self):
+        """Test P8 matches a marked pentagon with broken sides and finds their midpoints."""
+        nodes, midpoints, p = self._create_pentagon()
+
+        can_apply, matched = self.production.can_apply(self.graph)
+
+        self.assertTrue(can_apply)
+        self.assertIs(matched["pentagon_hyperedge"], p)
+        self.assertEqual(list(matched["nodes"]), nodes)
+        self.assertEqual(matched["midpoints"], midpoints)
+        self.assertEqual(len(matched["edges"]), 10)
+
+    def test_apply_without_midpoints_argument(self):
+        """Test apply uses the matched midpoints and builds five quadrilaterals around the centroid."""
+        nodes, midpoints, p = self._create_pentagon()
+        _, matched = self.production.can_apply(self.graph)
+
+        result = self.production.apply(self.graph, matched)
+
+        self.assertIs(result["original_pentagon"], p)
+        self.assertNotIn(p, self.graph.edges)
+        self.assertEqual(result["centroid"].label, "V")
+        self.assertEqual(result["new_quadrilaterals"], self.graph.get_edges("Q", 4))
+        assert_broken_into_quadrilaterals(self, self.graph, nodes, midpoints, result["centroid"])
+
+    def test_apply_with_explicit_midpoints(self):
+        """Test the midpoints can still be passed to apply explicitly."""
+        nodes, midpoints, p = self._create_pentagon()
+        _, matched = self.production.can_apply(self.graph)
+
+        result = self.production.apply(self.graph, matched, midpoints)
+
+        self.assertEqual(result["midpoints"], midpoints)
+        self.assertEqual(len(self.graph.get_edges("Q", 4, 0)), 5)
+
+    def test_runs_in_refinement_chain(self):
+        """Test a pentagon with marked sides is refined unattended by breaking the sides and P8."""
+        nodes, _, p = self._create_pentagon(broken=[])
+        for i in range(5):
+            self.graph.get_edge_between(nodes[i], nodes[(i + 1) % 5]).R = 1
+
+        applied = Scheduler(self.graph, [P4(), P3(), P8()]).run()
+
+        self.assertEqual(applied, 6)
+        self.assertNotIn(p, self.graph.edges)
+        self.assertEqual(len(self.graph.get_edges("Q", 4, 0)), 5)
+        self.assertEqual(len(self.graph.nodes), 11)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
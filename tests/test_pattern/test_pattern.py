@@ -0,0 +1,152 @@
+import unittest
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from hypergraph.hypergraph import HyperGraph
+from productions import P8
+from productions.pattern import Pattern
+
+
+class TestPattern(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = HyperGraph()
+
+    def _polygon(self, coords, label, broken=()):
+        """Add a polygon with its side edges; sides listed in broken get a hanging midpoint instead."""
+        nodes = [self.graph.add_node(x, y) for x, y in coords]
+        sides = []
+        for i, (a, b) in enumerate(zip(nodes, nodes[1:] + nodes[:1])):
+            if i in broken:
+                mid = self.graph.add_node((a.x + b.x) / 2, (a.y + b.y) / 2)
+                sides.append((mid, self.graph.add_edge(a, mid), self.graph.add_edge(mid, b)))
+            else:
+                sides.append(self.graph.add_edge(a, b, is_border=True))
+        return self.graph.add_hyperedge(nodes, label=label), nodes, sides
+
+    def test_root_bucket(self):
+        """Test candidates come from the (label, arity, R) bucket."""
+        q, nodes, sides = self._polygon([(0, 0), (1, 0), (1, 1), (0, 1)], "Q")
+        pattern = Pattern("Q", 4, 0)
+
+        self.assertEqual(pattern.anchor, ("Q", 4, 0))
+        self.assertEqual([found.anchor for found in pattern.iter_matches(self.graph)], [q])
+        self.assertEqual(list(Pattern("Q", 4, 1).iter_matches(self.graph)), [])
+        self.assertIsNone(Pattern("Q", 4, 1).match(self.graph, q))
+        self.assertIsNone(pattern.match(self.graph, sides[0]))
+
+    def test_sides_and_side_flags(self):
+        """Test side edges are found in node order and filtered by label and R."""
+        q, nodes, sides = self._polygon([(0, 0), (1, 0), (1, 1), (0, 1)], "Q")
+
+        found = Pattern("Q", 4, 0, sides=True).match(self.graph, q)
+        self.assertEqual(found.sides, sides)
+        self.assertEqual(found.nodes, tuple(nodes))
+        self.assertIsNone(found.midpoints)
+
+        sides[2].R = 1
+        self.assertIsNone(Pattern("Q", 4, 0, sides=True, side_R=0).match(self.graph, q))
+        self.assertIsNotNone(Pattern("Q", 4, 0, sides=True, side_label="E").match(self.graph, q))
+        sides[1].label = "X"
+        self.assertIsNone(Pattern("Q", 4, 0, sides=True, side_label="E").match(self.graph, q))
+
+        self.graph.remove_edge(sides[3])
+        self.assertIsNone(Pattern("Q", 4, 0, sides=True).match(self.graph, q))
+
+    def test_border_flag(self):
+        """Test the B flag of a 2-node root."""
+        n1 = self.graph.add_node(0, 0)
+        n2 = self.graph.add_node(1, 0)
+        edge = self.graph.add_edge(n1, n2, is_border=True)
+
+        self.assertIsNotNone(Pattern("E", 2, 0, border=True).match(self.graph, edge))
+        self.assertIsNone(Pattern("E", 2, 0, border=False).match(self.graph, edge))
+        self.assertIsNotNone(Pattern("E", 2, 0).match(self.graph, edge))
+
+    def test_midpoint_rules(self):
+        """Test hanging, located and absent midpoints of a 2-node root."""
+        n1 = self.graph.add_node(0, 0)
+        n2 = self.graph.add_node(2, 0)
+        edge = self.graph.add_edge(n1, n2)
+
+        self.assertIsNone(Pattern("E", 2, 0, midpoints="hanging").match(self.graph, edge))
+        self.assertIsNone(Pattern("E", 2, 0, midpoints="located").match(self.graph, edge))
+        self.assertIsNotNone(Pattern("E", 2, 0, midpoints="absent").match(self.graph, edge))
+
+        mid = self.graph.add_node(1, 0)
+        self.assertEqual(Pattern("E", 2, 0, midpoints="located").match(self.graph, edge).midpoints, [mid])
+        self.assertIsNone(Pattern("E", 2, 0, midpoints="hanging").match(self.graph, edge))
+        self.assertIsNotNone(Pattern("E", 2, 0, midpoints="absent").match(self.graph, edge))
+
+        first = self.graph.add_edge(n1, mid)
+        second = self.graph.add_edge(mid, n2)
+        found = Pattern("E", 2, 0, midpoints="hanging").match(self.graph, edge)
+        self.assertEqual(found.midpoints, [mid])
+        self.assertEqual(found.halves, [(first, second)])
+        self.assertIsNone(Pattern("E", 2, 0, midpoints="absent").match(self.graph, edge))
+
+        second.R = 1
+        self.assertIsNone(Pattern("E", 2, 0, midpoints="hanging", midpoint_R=0).match(self.graph, edge))
+
+    def test_hanging_midpoint_not_at_center(self):
+        """Test a hanging node only has to be joined to both ends, like in P11."""
+        n1 = self.graph.add_node(0, 0)
+        n2 = self.graph.add_node(2, 0)
+        edge = self.graph.add_edge(n1, n2)
+        off = self.graph.add_node(1, 0.5)
+        self.graph.add_edge(n1, off)
+        self.graph.add_edge(off, n2)
+
+        self.assertEqual(Pattern("E", 2, 0, midpoints="hanging").match(self.graph, edge).midpoints, [off])
+        self.assertIsNotNone(Pattern("E", 2, 0, midpoints="absent").match(self.graph, edge))
+
+    def test_registered_midpoint_first(self):
+        """Test a registered midpoint is used before searching neighbours or coordinates."""
+        n1 = self.graph.add_node(0, 0)
+        n2 = self.graph.add_node(2, 0)
+        edge = self.graph.add_edge(n1, n2)
+        older = self.graph.add_node(1, 0.5)
+        self.graph.add_edge(n1, older)
+        self.graph.add_edge(older, n2)
+        mid = self.graph.add_node(1, 0.01)
+        self.graph.add_edge(n1, mid)
+        self.graph.add_edge(mid, n2)
+
+        hanging = Pattern("E", 2, 0, midpoints="hanging")
+        located = Pattern("E", 2, 0, midpoints="located")
+        matchers = [(pattern.compile(), pattern.compile(generated=False)) for pattern in (hanging, located)]
+        for match in matchers[0]:
+            self.assertEqual(match(self.graph, edge).midpoints, [older])
+        for match in matchers[1]:
+            self.assertIsNone(match(self.graph, edge))
+
+        self.graph.register_midpoint(n1, n2, mid)
+        for match in matchers[0] + matchers[1]:
+            self.assertEqual(match(self.graph, edge).midpoints, [mid])
+
+    def test_invalid_pattern(self):
+        """Test invalid patterns are rejected when they are declared."""
+        with self.assertRaises(ValueError):
+            Pattern("Q", 4, 0, midpoints="somewhere")
+        with self.assertRaises(ValueError):
+            Pattern("Q", 4, 0, sides=True, midpoints="hanging")
+
+    def test_p8_matches_broken_pentagon(self):
+        """Test P8 matches a marked pentagon once all its sides have hanging midpoints."""
+        coords = [(0, 0), (2, 0), (3, 2), (1, 3), (-1, 2)]
+        p, nodes, sides = self._polygon(coords, "P", broken=range(5))
+        p.R = 1
+
+        can_apply, matched = P8().can_apply(self.graph)
+
+        self.assertTrue(can_apply)
+        self.assertIs(matched['pentagon_hyperedge'], p)
+        self.assertEqual(matched['midpoints'], [mid for mid, _, _ in sides])
+        self.assertEqual(len(matched['edges']), 10)
+
+        self.graph.remove_edge(sides[2][1])
+        self.assertFalse(P8().can_apply(self.graph)[0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,106 @@
+import unittest
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.append(project_root)
+sys.path.append(os.path.join(project_root, 'loops'))
+sys.path.append(os.path.join(project_root, 'tests'))
+from hypergraph.hypergraph import HyperGraph
+from productions import P0, P1, P6, P7, P8, P9, P10, P12, P13, P14
+from productions.polygon import MarkElement, MarkSides, BreakElement, iter_family_matches
+from mesh_generator import create_mixed_tiling, create_polygon_strip
+from polygon_helpers import create_broken_polygon, assert_broken_into_quadrilaterals
+
+
+class TestPolygonEngine(unittest.TestCase):
+
+    def test_families(self):
+        """Test the per-type productions are thin wrappers around the shared engine."""
+        for production in (P0, P6, P9, P12):
+            self.assertTrue(issubclass(production, MarkElement))
+        for production in (P1, P7, P10, P13):
+            self.assertTrue(issubclass(production, MarkSides))
+        for production in (P8, P14):
+            self.assertTrue(issubclass(production, BreakElement))
+        self.assertEqual([p.anchor[1] for p in (P0, P6, P9, P12)], [4, 5, 6, 7])
+
+    def test_family_matches_in_graph_order(self):
+        """Test one pass over all element types yields the matches of every production, by id."""
+        graph = create_mixed_tiling(5, 5, seed=3)
+        productions = [P0(), P6(), P9(), P12()]
+
+        found = list(iter_family_matches(graph, productions))
+
+        expected = sorted(
+            ((production, matched) for production in productions for matched in production.iter_matches(graph)),
+            key=lambda item: item[1]['hyperedge'].id
+        )
+        self.assertEqual(found, expected)
+        self.assertEqual(len(found), len([edge for edge in graph.edges if edge.is_hyperedge()]))
+
+    def test_family_matches_reject_shared_anchor(self):
+        """Test two productions rooted at the same element type are rejected."""
+        with self.assertRaises(ValueError):
+            list(iter_family_matches(create_mixed_tiling(2, 2), [P0(), P0()]))
+
+    def test_mark_sides_of_every_type(self):
+        """Test the edge-marking engine handles every marked polygon type the same way."""
+        graph = create_mixed_tiling(3, 3, seed=1, marked=1.0)
+        productions = [P10(), P13()]
+
+        for production, matched in list(iter_family_matches(graph, productions)):
+            production.apply(graph, matched)
+
+        for edge in graph.edges:
+            if edge.is_hyperedge() and edge.label in ("S", "T"):
+                for a, b in zip(edge.nodes, edge.nodes[1:] + edge.nodes[:1]):
+                    self.assertEqual(graph.get_edge_between(a, b).R, 1)
+
+    def test_productions_keep_their_messages(self):
+        """Test productions built on the shared engine print what they printed on their own."""
+        for production, label, marked, expected in (
+            (P1(), "Q", 1.0, []),
+            (P6(), "P", 0.0, ["[P6] Marked pentagon hyperedge for refinement (R: 0 -> 1)"]),
+            (P7(), "P", 1.0, ["Successfully applied P7"]),
+            (P10(), "S", 1.0, ["Successfully applied P10! Marked edges for breaking.(E.R: 0 -> 1)"]),
+        ):
+            with self.subTest(production=production.name):
+                graph = create_polygon_strip(label, 1, marked=marked)
+                _, matched = production.can_apply(graph)
+                output = io.StringIO()
+
+                with redirect_stdout(output):
+                    production.apply(graph, matched)
+
+                self.assertEqual(output.getvalue().splitlines()[:1], expected)
+
+    def test_break_every_type(self):
+        """Test the breaking engine matches and breaks pentagons (P8) and heptagons (P14) the same way."""
+        for production, label, count in ((P8(), "P", 5), (P14(), "T", 7)):
+            with self.subTest(production=production.name):
+                graph = HyperGraph()
+                create_broken_polygon(graph, label, count, broken=range(count - 1))
+                self.assertEqual(production.can_apply(graph), (False, None))
+
+                graph = HyperGraph()
+                create_broken_polygon(graph, label, count, r_value=0)
+                self.assertEqual(production.can_apply(graph), (False, None))
+
+                graph = HyperGraph()
+                nodes, midpoints, hyperedge = create_broken_polygon(graph, label, count)
+                can_apply, matched = production.can_apply(graph)
+                self.assertTrue(can_apply)
+                self.assertEqual(matched["midpoints"], midpoints)
+                self.assertEqual(len(matched["edges"]), 2 * count)
+
+                production.apply(graph, matched)
+
+                self.assertNotIn(hyperedge, graph.edges)
+                center = graph.get_edges("Q", 4, 0)[0].nodes[2]
+                assert_broken_into_quadrilaterals(self, graph, nodes, midpoints, center)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,152 @@
+import unittest
+import os
+import sys
+import pickle
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from hypergraph.hypergraph import HyperGraph
+from productions import Production, P0, P1, P2, P3, P5, P8
+
+
+class TestProductionBase(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = HyperGraph()
+
+    def _quad(self):
+        n1 = self.graph.add_node(0, 0)
+        n2 = self.graph.add_node(1, 0)
+        n3 = self.graph.add_node(1, 1)
+        n4 = self.graph.add_node(0, 1)
+
+        self.graph.add_edge(n1, n2, is_border=True)
+        self.graph.add_edge(n2, n3, is_border=True)
+        self.graph.add_edge(n3, n4, is_border=True)
+        self.graph.add_edge(n4, n1, is_border=True)
+
+        return self.graph.add_hyperedge([n1, n2, n3, n4], label="Q")
+
+    def test_match_to_ids_roundtrip(self):
+        """Test matched elements survive encoding to ids and back."""
+        self._quad()
+        production = P0()
+
+        can_apply, matched = production.can_apply(self.graph)
+        self.assertTrue(can_apply)
+
+        ids = production.match_to_ids(matched)
+        restored = production.match_from_ids(self.graph, pickle.loads(pickle.dumps(ids)))
+
+        self.assertEqual(restored, matched)
+        self.assertIs(restored['hyperedge'], matched['hyperedge'])
+        self.assertIsInstance(restored['edges'], list)
+        self.assertIsInstance(restored['nodes'], tuple)
+
+    def test_match_to_ids_contains_only_plain_values(self):
+        """Test encoded matches hold ids, not graph objects."""
+        q = self._quad()
+        production = P0()
+
+        can_apply, matched = production.can_apply(self.graph)
+        ids = production.match_to_ids(matched)
+
+        self.assertIn(('hyperedge', ('E', q.id)), ids[1])
+        self.assertLess(len(pickle.dumps(ids)), 300)
+
+    def test_decoded_match_can_be_applied(self):
+        """Test a match rebuilt from ids can be applied to the graph."""
+        n1 = self.graph.add_node(0, 0)
+        n2 = self.graph.add_node(2, 0)
+        n3 = self.graph.add_node(1, 0)
+        target = self.graph.add_edge(n1, n2)
+        target.R = 1
+        self.graph.add_edge(n1, n3)
+        self.graph.add_edge(n3, n2)
+        production = P2()
+
+        can_apply, matched = production.can_apply(self.graph)
+        ids = production.match_to_ids(matched)
+        production.apply(self.graph, production.match_from_ids(self.graph, ids))
+
+        self.assertNotIn(target, self.graph.edges)
+
+    def test_iter_matches_yields_every_match(self):
+        """Test iter_matches lists all matches in graph order and can_apply returns the first."""
+        first = self._quad()
+        n5 = self.graph.add_node(2, 0)
+        n6 = self.graph.add_node(2, 1)
+        n2, n3 = first.nodes[1], first.nodes[2]
+        self.graph.add_edge(n2, n5, is_border=True)
+        self.graph.add_edge(n5, n6, is_border=True)
+        self.graph.add_edge(n6, n3, is_border=True)
+        second = self.graph.add_hyperedge([n2, n5, n6, n3], label="Q")
+        production = P0()
+
+        matches = list(production.iter_matches(self.graph))
+
+        self.assertEqual([m['hyperedge'] for m in matches], [first, second])
+        self.assertEqual(production.can_apply(self.graph), (True, matches[0]))
+        self.assertEqual(list(production.iter_matches(self.graph, second)), [matches[1]])
+
+        first.R = 1
+        self.assertEqual([m['hyperedge'] for m in production.iter_matches(self.graph)], [second])
+        self.assertEqual([m['hyperedge'] for m in P1().iter_matches(self.graph)], [first])
+
+    def test_iter_matches_is_lazy(self):
+        """Test matches are produced one at a time."""
+        n1 = self.graph.add_node(0, 0)
+        n2 = self.graph.add_node(2, 0)
+        n3 = self.graph.add_node(4, 0)
+        e1 = self.graph.add_edge(n1, n2)
+        e2 = self.graph.add_edge(n2, n3)
+        e1.R = 1
+        e2.R = 1
+
+        matches = P3().iter_matches(self.graph)
+
+        self.assertIs(next(matches)['edge'], e1)
+        self.assertIs(next(matches)['edge'], e2)
+        self.assertIsNone(next(matches, None))
+
+    def test_iter_matches_not_implemented(self):
+        """Test the base class requires productions to implement iter_matches."""
+        with self.assertRaises(NotImplementedError):
+            Production("PX", "test").iter_matches(self.graph)
+
+
+    def test_matches_at_any_element(self):
+        """Test matches_at finds the matches lying on a node, an edge or a hyperedge."""
+        first = self._quad()
+        n1, n2, n3 = first.nodes[:3]
+        n5 = self.graph.add_node(2, 0)
+        n6 = self.graph.add_node(2, 1)
+        self.graph.add_edge(n2, n5, is_border=True)
+        self.graph.add_edge(n5, n6, is_border=True)
+        self.graph.add_edge(n6, n3, is_border=True)
+        second = self.graph.add_hyperedge([n2, n5, n6, n3], label="Q")
+        shared = self.graph.get_edge_between(n2, n3)
+        production = P0()
+
+        def anchors(element, production=production, key='hyperedge'):
+            return [m[key] for m in production.matches_at(self.graph, element)]
+
+        self.assertEqual(anchors(n1), [first])
+        self.assertEqual(anchors(n2), [first, second])
+        self.assertEqual(anchors(shared), [first, second])
+        self.assertEqual(anchors(second), [second])
+
+        shared.B = False
+        shared.R = 1
+        self.assertEqual(anchors(first, P3(), 'edge'), [shared])
+        self.assertEqual(anchors(n3, P3(), 'edge'), [shared])
+        self.assertEqual(anchors(n1, P3(), 'edge'), [])
+
+        for other in (P1(), P2(), P5(), P8()):
+            self.assertEqual(other.matches_at(self.graph, first), [])
+
+        self.graph.remove_edge(second)
+        self.assertEqual(anchors(second), [])
+        self.assertEqual(anchors(n2), [first])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,150 @@
+import unittest
+import os
+import sys
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.append(project_root)
+sys.path.append(os.path.join(project_root, 'loops'))
+from productions import P0, P1, P2, P3, P4, P5, P7, P9, P10, P11, Scheduler, independent_matches
+from mesh_generator import create_quad_grid, create_mixed_tiling, create_polygon_strip
+
+
+def refinement_chain():
+    return [P10(), P4(), P3(), P11(), P1(), P4(), P2(), P3(), P5()]
+
+
+def apply_while(graph, productions):
+    """Reference loop: rescan with can_apply until a whole pass applies nothing."""
+    applied = []
+    while True:
+        progress = False
+        for production in productions:
+            while True:
+                can_apply, matched = production.can_apply(graph)
+                if not can_apply:
+                    break
+                applied.append((productions.index(production), production.match_to_ids(matched)))
+                production.apply(graph, matched)
+                progress = True
+        if not progress:
+            return applied
+
+
+def scheduled(graph, productions, deterministic=True):
+    applied = []
+    for production, matched in Scheduler(graph, productions, deterministic):
+        applied.append((productions.index(production), production.match_to_ids(matched)))
+        production.apply(graph, matched)
+    return applied
+
+
+class TestScheduler(unittest.TestCase):
+
+    def assertFixedPoint(self, graph, productions):
+        for production in productions:
+            self.assertFalse(production.can_apply(graph)[0], production.name)
+
+    def test_deterministic_mode_matches_apply_while(self):
+        """Test the scheduler applies the same matches in the same order as apply_while."""
+        for build in (
+            lambda: create_quad_grid(4, 4, seed=1, marked=0.3),
+            lambda: create_mixed_tiling(4, 4, seed=5, marked=0.4),
+        ):
+            productions = [P9()] + refinement_chain()
+            expected = apply_while(build(), productions)
+
+            graph = build()
+            self.assertEqual(scheduled(graph, productions), expected)
+            self.assertGreater(len(expected), 0)
+            self.assertFixedPoint(graph, productions)
+
+    def test_worklist_mode_reaches_fixed_point(self):
+        """Test the worklist order also refines every marked element."""
+        graph = create_quad_grid(5, 5, seed=3, marked=0.3)
+        marked = len(graph.get_edges("Q", 4, 1))
+        productions = refinement_chain()
+
+        applied = scheduled(graph, productions, deterministic=False)
+
+        self.assertFixedPoint(graph, productions)
+        self.assertEqual(graph.get_edges("Q", 4, 1), [])
+        self.assertEqual(sum(1 for index, _ in applied if productions[index].name == "P5"), marked)
+
+    def test_run_counts_applications(self):
+        """Test run() applies every match and returns how many were applied."""
+        graph = create_quad_grid(3, 3, seed=0, marked=0.5)
+        expected = len(apply_while(create_quad_grid(3, 3, seed=0, marked=0.5), refinement_chain()))
+
+        self.assertEqual(Scheduler(graph, refinement_chain()).run(), expected)
+
+    def test_fixed_point_without_rescan(self):
+        """Test a graph with nothing to apply is only scanned once, and work stays local."""
+        graph = create_quad_grid(20, 20)
+        scheduler = Scheduler(graph, refinement_chain())
+
+        self.assertEqual(scheduler.run(), 0)
+        initial_scan = scheduler.matcher.evaluations
+
+        graph = create_quad_grid(20, 20)
+        graph.get_edges("Q", 4, 0)[0].R = 1
+        scheduler = Scheduler(graph, refinement_chain())
+        applied = scheduler.run()
+
+        self.assertGreater(applied, 0)
+        self.assertLess(scheduler.matcher.evaluations, initial_scan + 20 * applied)
+
+    def test_marking_batch_needs_one_round(self):
+        """Test P0 marks a whole grid in a single round, since marks never overlap."""
+        graph = create_quad_grid(10, 10)
+
+        rounds, applied = Scheduler(graph, [P0()]).run_batched()
+
+        self.assertEqual((rounds, applied), (1, 100))
+        self.assertEqual(len(graph.get_edges("Q", 4, 1)), 100)
+
+    def test_batched_run_stops_when_round_changes_nothing(self):
+        """Test run_batched ends when P7's matches survive apply() but the graph no longer changes."""
+        graph = create_polygon_strip('P', 1, marked=1.0)
+
+        rounds, applied = Scheduler(graph, [P7()]).run_batched()
+
+        self.assertEqual((rounds, applied), (2, 2))
+        self.assertEqual(graph.get_edges("E", 2, 0), [])
+        self.assertTrue(P7().can_apply(graph)[0])
+
+        graph = create_polygon_strip('P', 3, marked=1.0)
+
+        self.assertEqual(Scheduler(graph, [P7()]).run_batched(), (2, 4))
+        self.assertEqual(Scheduler(graph, [P7()]).run_batched(), (1, 2))
+
+    def test_independent_matches_share_no_modified_element(self):
+        """Test the batch is conflict-free and maximal for P1, whose neighbours share edges."""
+        graph = create_quad_grid(4, 4, marked=1.0)
+        production = P1()
+        matches = list(production.iter_matches(graph))
+
+        batch = independent_matches(production, matches)
+
+        used = [edge for matched in batch for edge in matched['edges']]
+        self.assertEqual(len(used), len(set(used)))
+        for matched in matches:
+            if matched not in batch:
+                self.assertTrue(set(matched['edges']) & set(used))
+        self.assertLess(len(batch), len(matches))
+
+    def test_batched_refinement_reaches_fixed_point(self):
+        """Test batched rounds refine the mesh like the sequential run, in fewer steps."""
+        graph = create_quad_grid(6, 6, seed=4, marked=0.3)
+        sequential = create_quad_grid(6, 6, seed=4, marked=0.3)
+        productions = refinement_chain()
+
+        rounds, applied = Scheduler(graph, productions).run_batched()
+        Scheduler(sequential, refinement_chain()).run()
+
+        self.assertFixedPoint(graph, productions)
+        self.assertLess(rounds, applied)
+        self.assertEqual(len(graph.nodes), len(sequential.nodes))
+        self.assertEqual(len(graph.get_edges("Q", 4)), len(sequential.get_edges("Q", 4)))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)